@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 import sys
 from typing import Optional, Any
@@ -50,6 +50,10 @@ class SiteConfig:
         404_content: HTML content for the 404 error page.
         default_language: Default language code (e.g., "en") used for fallback and interface translations.
         languages: List of supported language codes for content (e.g., ["en", "it"]).
+        thumb_format: Gallery thumbnail format: "webp", "avif" or "original"
+            (same format as the source image).
+        markdown_engine: Markdown converter: "python-markdown" or
+            "markdown-it" (markdown-it-py, faster, CommonMark output).
     """
 
     site_name: str
@@ -63,13 +67,17 @@ class SiteConfig:
     not_found_content: str = '<p>The page you\'re looking for doesn\'t exist.</p><p><a href="/">Return to the homepage</a></p>'
     default_language: str = "en"
     languages: list[str] = field(default_factory=lambda: ["en"])
+    thumb_format: str = "webp"
+    markdown_engine: str = "python-markdown"
 
 
-def read_config(site_root: Path) -> SiteConfig:
+def read_config(site_root: Path, *, verify_assets: bool = True) -> SiteConfig:
     """Read site's config.toml and return a SiteConfig object.
 
     Args:
         site_root: Path to the site project root (contains config.toml).
+        verify_assets: Log a warning when the configured theme HTML/CSS files
+            are missing. Callers that check the theme themselves can skip it.
 
     Returns:
         SiteConfig instance.
@@ -81,18 +89,26 @@ def read_config(site_root: Path) -> SiteConfig:
     """
     cfg_path = site_root / "config.toml"
 
-    # Check if config file exists
-    if not cfg_path.exists():
-        raise FileNotFoundError(f"config.toml not found at: {cfg_path}")
+    # Reuse the parsed config while the file is unchanged on disk
+    try:
+        st = cfg_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"config.toml not found at: {cfg_path}") from None
+    cache_key = (str(cfg_path.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        # Hand out a copy: callers (e.g. generate_site) adjust languages in place
+        return replace(cached, languages=list(cached.languages))
 
     # Read and parse the file
     try:
-        raw = cfg_path.read_bytes()
         if tomllib is not None:
-            data = tomllib.loads(raw.decode("utf-8"))
+            with cfg_path.open("rb") as f:
+                data = tomllib.load(f)
             logger.debug("Using tomllib for TOML parsing")
         elif toml is not None:  # pragma: no cover
-            data = toml.loads(raw.decode("utf-8"))
+            with cfg_path.open("r", encoding="utf-8") as f:
+                data = toml.load(f)
             logger.debug("Using toml package for TOML parsing (fallback)")
         else:  # pragma: no cover
             raise RuntimeError(
@@ -109,25 +125,57 @@ def read_config(site_root: Path) -> SiteConfig:
         error_msg = "Invalid configuration in config.toml:\n" + "\n".join(f"  - {err}" for err in validation_errors)
         raise ValueError(error_msg)
 
-    # Validate theme file paths
-    theme_path = config_data["base_theme"]
-    css_path = config_data["theme_css"]
+    if verify_assets:
+        # Validate theme file paths
+        theme_path = config_data["base_theme"]
+        css_path = config_data["theme_css"]
+
+        # Check if theme files exist relative to site root
+        theme_file = site_root / theme_path
+        css_file = site_root / css_path
+
+        warnings = []
+        if not theme_file.exists():
+            warnings.append(f"Theme file '{theme_path}' not found at {theme_file}")
+        if not css_file.exists():
+            warnings.append(f"CSS file '{css_path}' not found at {css_file}")
+
+        if warnings:
+            for warning in warnings:
+                logger.warning(warning)
+
+    cfg = SiteConfig(**config_data)
+    _CONFIG_CACHE[cache_key] = cfg
+    return replace(cfg, languages=list(cfg.languages))
+
+
+# Parsed configs keyed by (resolved path, mtime_ns, size) of config.toml
+_CONFIG_CACHE: dict[tuple[str, int, int], SiteConfig] = {}
+read_config.cache_clear = _CONFIG_CACHE.clear  # type: ignore[attr-defined]
 
-    # Check if theme files exist relative to site root
-    theme_file = site_root / theme_path
-    css_file = site_root / css_path
 
-    warnings = []
-    if not theme_file.exists():
-        warnings.append(f"Theme file '{theme_path}' not found at {theme_file}")
-    if not css_file.exists():
-        warnings.append(f"CSS file '{css_path}' not found at {css_file}")
+# Known config fields as (name, expected type, default value)
+_CONFIG_SCHEMA: tuple[tuple[str, type, Any], ...] = (
+    ("site_name", str, "My Site"),
+    ("author", str, "Unknown"),
+    ("footer", str, "Copyright 2025"),
+    ("output", str, "output"),
+    ("base_theme", str, "assets/theme.html"),
+    ("theme_css", str, "assets/theme.css"),
+    ("base_url", str, None),
+    ("not_found_title", str, "404 - Page Not Found"),
+    ("not_found_content", str, '<p>The page you\'re looking for doesn\'t exist.</p><p><a href="/">Return to the homepage</a></p>'),
+    ("default_language", str, "en"),
+    ("languages", list, ["en"]),
+    ("thumb_format", str, "webp"),
+    ("markdown_engine", str, "python-markdown"),
+)
 
-    if warnings:
-        for warning in warnings:
-            logger.warning(warning)
+# Accepted values for thumb_format
+THUMB_FORMATS = ("webp", "avif", "original")
 
-    return SiteConfig(**config_data)
+# Accepted values for markdown_engine
+MARKDOWN_ENGINES = ("python-markdown", "markdown-it")
 
 
 def _validate_config_data(data: dict) -> tuple[dict, list[str]]:
@@ -143,35 +191,16 @@ def _validate_config_data(data: dict) -> tuple[dict, list[str]]:
     errors = []
     validated = {}
 
-    # Define required and optional fields with their expected types and defaults
-    schema = {
-        "site_name": {"type": str, "default": "My Site", "required": False},
-        "author": {"type": str, "default": "Unknown", "required": False},
-        "footer": {"type": str, "default": "Copyright 2025", "required": False},
-        "output": {"type": str, "default": "output", "required": False},
-        "base_theme": {"type": str, "default": "assets/theme.html", "required": False},
-        "theme_css": {"type": str, "default": "assets/theme.css", "required": False},
-        "base_url": {"type": str, "default": None, "required": False},
-        "not_found_title": {"type": str, "default": "404 - Page Not Found", "required": False},
-        "not_found_content": {"type": str, "default": '<p>The page you\'re looking for doesn\'t exist.</p><p><a href="/">Return to the homepage</a></p>', "required": False},
-        "default_language": {"type": str, "default": "en", "required": False},
-        "languages": {"type": list, "default": ["en"], "required": False},
-    }
-
-    for field_name, field_config in schema.items():
+    for field_name, expected_type, default in _CONFIG_SCHEMA:
         value = data.get(field_name)
 
         if value is None:
-            # Use default value for optional fields
-            if not field_config["required"]:
-                validated[field_name] = field_config["default"]
-                logger.debug(f"Using default value for {field_name}: {field_config['default']}")
-            else:
-                errors.append(f"Required field '{field_name}' is missing")
+            # All fields are optional: fall back to the default value
+            validated[field_name] = default.copy() if isinstance(default, list) else default
+            logger.debug(f"Using default value for {field_name}: {default}")
             continue
 
         # Type validation
-        expected_type = field_config["type"]
         if not isinstance(value, expected_type):
             try:
                 # Try to convert to expected type
@@ -200,6 +229,12 @@ def _validate_config_data(data: dict) -> tuple[dict, list[str]]:
         elif field_name == "languages":
             if isinstance(validated[field_name], list) and not all(isinstance(i, str) for i in validated[field_name]):
                 errors.append(f"Field 'languages' must contain only string values")
+        elif field_name == "thumb_format":
+            if validated[field_name] not in THUMB_FORMATS:
+                errors.append(f"Field 'thumb_format' must be one of {', '.join(THUMB_FORMATS)}: {validated[field_name]}")
+        elif field_name == "markdown_engine":
+            if validated[field_name] not in MARKDOWN_ENGINES:
+                errors.append(f"Field 'markdown_engine' must be one of {', '.join(MARKDOWN_ENGINES)}: {validated[field_name]}")
 
     return validated, errors
 
@@ -245,6 +280,15 @@ def sanitize_path(user_path: str, allowed_base_path: Path, base_dir: Path = None
     return resolved
 
 
+# Characters that must be escaped inside a TOML basic (double-quoted) string
+_TOML_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def _toml_escape(value: str) -> str:
+    """Escape a value for use inside a TOML basic string."""
+    return value.translate(_TOML_ESCAPES)
+
+
 def write_config_toml(
     site_root: Path,
     site_name: str,
@@ -296,21 +340,21 @@ def write_config_toml(
 
     # Write the config file
     try:
-        content = (
-            f"site_name = \"{site_name}\"\n"
-            f"author = \"{author}\"\n"
-            f"footer = \"{footer}\"\n"
-            f"output = \"{output}\"\n"
-            f"base_theme = \"{base_theme}\"\n"
-            f"theme_css = \"{theme_css}\"\n"
-        )
+        lines = [
+            f'site_name = "{_toml_escape(site_name)}"',
+            f'author = "{_toml_escape(author)}"',
+            f'footer = "{_toml_escape(footer)}"',
+            f'output = "{_toml_escape(output)}"',
+            f'base_theme = "{_toml_escape(base_theme)}"',
+            f'theme_css = "{_toml_escape(theme_css)}"',
+        ]
         if base_url is not None:
-            content += f"base_url = \"{base_url}\"\n"
-        content += f"default_language = \"{default_language}\"\n"
-        languages_list = config_dict["languages"]
-        content += f"languages = {languages_list!r}\n"
+            lines.append(f'base_url = "{_toml_escape(base_url)}"')
+        lines.append(f'default_language = "{_toml_escape(default_language)}"')
+        languages_list = ", ".join(f'"{_toml_escape(lang)}"' for lang in config_dict["languages"])
+        lines.append(f"languages = [{languages_list}]")
         cfg_path = site_root / "config.toml"
-        cfg_path.write_text(content, encoding="utf-8")
+        cfg_path.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
         logger.info(f"Successfully wrote config.toml to {cfg_path}")
     except Exception as e:
         raise IOError(f"Failed to write config.toml: {e}") from e
@@ -10,9 +10,14 @@ Stores persistent user preferences in a JSON file, such as:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class ConfigManager:
     """Manage a JSON-based user configuration for the TUI.
@@ -29,6 +34,9 @@ class ConfigManager:
         "last_base_dir": str(Path.home()),
     }
 
+    # Parsed file contents keyed by path, tagged with (mtime_ns, size)
+    _FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
     def __init__(self, config_path: Optional[Path] = None) -> None:
         """Initialize the configuration manager.
 
@@ -54,9 +62,23 @@ class ConfigManager:
         Any read/parse error falls back to defaults to avoid crashing the TUI.
         """
         try:
-            if self.config_path.exists():
-                raw = self.config_path.read_text(encoding="utf-8")
-                data = json.loads(raw)
+            try:
+                st = self.config_path.stat()
+            except FileNotFoundError:
+                st = None
+            if st is not None:
+                stamp = (st.st_mtime_ns, st.st_size)
+                key = str(self.config_path)
+                cached = self._FILE_CACHE.get(key)
+                if cached is not None and cached[0] == stamp:
+                    data = cached[1]
+                else:
+                    if orjson is not None:
+                        data = orjson.loads(self.config_path.read_bytes())
+                    else:
+                        raw = self.config_path.read_text(encoding="utf-8")
+                        data = json.loads(raw)
+                    self._FILE_CACHE[key] = (stamp, data)
                 if isinstance(data, dict):
                     # Merge with defaults to keep forward compatibility
                     merged = dict(self.DEFAULTS)
@@ -86,7 +108,10 @@ class ConfigManager:
         """
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            self.config_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+            if orjson is not None:
+                self.config_path.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+            else:
+                self.config_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
         except Exception as e:
             # Silently ignore to not disturb the UI; logging can be added by caller if needed
             # This might be called without the TUI available yet, so print to console as fallback
@@ -187,12 +212,10 @@ class ConfigManager:
         Args:
             path_str: Absolute path string to insert.
         """
-        # Keep a small MRU list without duplicates
-        mru: List[str] = [str(p) for p in self._data.get("recent_sites", []) if isinstance(p, (str,))]
-        # Remove if exists, then insert at top
-        mru = [p for p in mru if p != path_str]
-        mru.insert(0, path_str)
-        # Trim to 10 entries
+        # Keep a small MRU list without duplicates: new path first, then the
+        # previous entries (strings only) minus the new one, trimmed to 10
+        items = self._data.get("recent_sites", []) or []
+        mru: List[str] = [path_str] + [p for p in items if isinstance(p, str) and p != path_str]
         self._data["recent_sites"] = mru[:10]
 
     # -------------------------- Wizard base dir -------------------------- #
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class I18N:
@@ -18,15 +18,21 @@ class I18N:
 
     def __init__(self, language: str = DEFAULT_LANGUAGE) -> None:
         self._translations: Dict[str, Dict[str, Any]] = {}
+        self._loaded: set[str] = set()  # Languages already attempted (found or not)
+        self._flat: Optional[Dict[str, str]] = None  # Current language merged over English
         self._current_language = language
         self._languages_dir = Path(__file__).parent / "languages"
 
         # Create languages directory if it doesn't exist
         self._languages_dir.mkdir(exist_ok=True)
 
-        # Load default language first, then current language
-        self._load_language("en")
-        self._load_language(language)
+        # Language files are loaded on the first lookup that needs them
+
+    def _ensure_loaded(self, language: str) -> None:
+        """Load a language file once; missing or broken files are not retried."""
+        if language not in self._loaded:
+            self._loaded.add(language)
+            self._load_language(language)
 
     def _load_language(self, language: str) -> None:
         """Load translations for a specific language."""
@@ -43,31 +49,40 @@ class I18N:
 
     def set_language(self, language: str) -> None:
         """Change the current language."""
+        # Load language if not already loaded
+        self._ensure_loaded(language)
         if language in self._translations:
             self._current_language = language
-        else:
-            # Load language if not already loaded
-            self._load_language(language)
-            if language in self._translations:
-                self._current_language = language
+            self._flat = None
 
     def get_language(self) -> str:
         """Get current language."""
         return self._current_language
 
+    def _build_flat(self) -> Dict[str, str]:
+        """Merge the current language over English into one key -> text table."""
+        self._ensure_loaded("en")
+        self._ensure_loaded(self._current_language)
+        flat = {k: str(v) for k, v in self._translations.get("en", {}).items()}
+        flat.update((k, str(v)) for k, v in self._translations.get(self._current_language, {}).items())
+        self._flat = flat
+        return flat
+
+    def table(self) -> Dict[str, str]:
+        """Return the merged key -> text table for the current language."""
+        flat = self._flat
+        if flat is None:
+            flat = self._build_flat()
+        return flat
+
     def translate(self, key: str, fallback: str = "") -> str:
         """Get translation for a key with fallback."""
-        if self._current_language in self._translations:
-            lang_dict = self._translations[self._current_language]
-            if key in lang_dict:
-                return str(lang_dict[key])
-
-        # Fallback to English
-        if "en" in self._translations:
-            en_dict = self._translations["en"]
-            if key in en_dict:
-                return str(en_dict[key])
-
+        flat = self._flat
+        if flat is None:
+            flat = self._build_flat()
+        value = flat.get(key)
+        if value is not None:
+            return value
         # Final fallback to provided fallback or the key itself
         return fallback or key
 
@@ -78,6 +93,8 @@ class I18N:
 
 # Global i18n instance
 _i18n_instance: I18N | None = None
+# Translation table of the global instance, bound on first use
+_FLAT: Dict[str, str] | None = None
 
 
 def get_i18n() -> I18N:
@@ -90,12 +107,22 @@ def get_i18n() -> I18N:
 
 def translate(key: str, fallback: str = "") -> str:
     """Global translate function."""
-    return get_i18n().translate(key, fallback)
+    global _FLAT
+    flat = _FLAT
+    if flat is None:
+        flat = _FLAT = get_i18n().table()
+    value = flat.get(key)
+    if value is not None:
+        return value
+    return fallback or key
 
 
 def set_global_language(language: str) -> None:
     """Set global language."""
-    get_i18n().set_language(language)
+    global _FLAT
+    i18n = get_i18n()
+    i18n.set_language(language)
+    _FLAT = i18n.table()
 
 
 def get_global_language() -> str:
@@ -2,11 +2,78 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import os
 import shutil
+import sys
+
+try:
+    import fcntl  # POSIX only
+except ImportError:
+    fcntl = None  # type: ignore
 
 from config import write_config_toml
 
+# Linux ioctl that clones a file's extents copy-on-write (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """Copy a file for copytree, using a reflink when the filesystem allows it.
+
+    A reflink shares the data blocks with the source until either side is
+    modified, so copying a theme costs metadata only. Hard links are not
+    used: the site's assets are meant to be edited without touching the
+    bundled themes. Falls back to a regular shutil.copy2.
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _sync_tree(src: Path, dst: Path) -> None:
+    """Mirror src into an existing dst, touching only entries that changed.
+
+    Files are compared by (size, mtime_ns), which copy2/copystat preserve,
+    so re-initializing over an untouched copy costs one stat per file.
+    Entries present in dst but not in src are removed.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(dst) as it:
+        existing = {entry.name: entry for entry in it}
+
+    with os.scandir(src) as it:
+        for entry in it:
+            target = dst / entry.name
+            old = existing.pop(entry.name, None)
+            if entry.is_dir(follow_symlinks=False):
+                if old is not None and not old.is_dir(follow_symlinks=False):
+                    os.remove(old.path)
+                _sync_tree(Path(entry.path), target)
+                continue
+            if old is not None:
+                if old.is_dir(follow_symlinks=False):
+                    shutil.rmtree(old.path)
+                else:
+                    src_st, dst_st = entry.stat(), old.stat()
+                    if (src_st.st_size, src_st.st_mtime_ns) == (dst_st.st_size, dst_st.st_mtime_ns):
+                        continue
+            _clone_file(entry.path, str(target))
+
+    # Drop anything the theme no longer provides
+    for leftover in existing.values():
+        if leftover.is_dir(follow_symlinks=False):
+            shutil.rmtree(leftover.path)
+        else:
+            os.remove(leftover.path)
+
 
 def initialize_site(
     base_path: Path,
@@ -31,37 +98,49 @@ def initialize_site(
     # Copy theme assets to site's assets folder
     theme_src = REPO_ROOT / "themes" / theme
     assets_dst = site_root / "assets"
-    if theme_src.exists() and theme_src.is_dir():
-        if assets_dst.exists():
-            shutil.rmtree(assets_dst)
-        shutil.copytree(theme_src, assets_dst)
-    else:
+    if not (theme_src.exists() and theme_src.is_dir()):
         raise ValueError(f"Theme '{theme}' not found in themes directory.")
 
-    # Write config.toml
-    write_config_toml(
-        site_root,
-        site_name=site_name,
-        author=author,
-        output="output",
-        footer="Copyright 2025",
-        base_theme="assets/theme.html",
-        theme_css="assets/theme.css",
-    )
-
-    # Create content/index.md
+    def copy_theme() -> None:
+        if assets_dst.exists():
+            # Re-initialization: only replace files that differ from the theme
+            _sync_tree(theme_src, assets_dst)
+        else:
+            shutil.copytree(theme_src, assets_dst, copy_function=_clone_file)
+
     content_dir = site_root / "content"
-    content_dir.mkdir(parents=True, exist_ok=True)
     index_md = (
         "---\n"
         f"title: {site_name}\n"
         "date: 2025-01-01\n"
         "---\n\n"
         "# Welcome\n\nThis is your new site. Edit content/index.md to get started.\n"
-    )
-    (content_dir / "index.md").write_text(index_md, encoding="utf-8")
+    ).encode("utf-8")
+
+    # The theme copy is I/O bound: run it in the background while the small
+    # scaffold files are written from this thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        theme_copy = pool.submit(copy_theme)
+
+        # Write config.toml
+        write_config_toml(
+            site_root,
+            site_name=site_name,
+            author=author,
+            output="output",
+            footer="Copyright 2025",
+            base_theme="assets/theme.html",
+            theme_css="assets/theme.css",
+        )
+
+        # Create content/index.md
+        content_dir.mkdir(parents=True, exist_ok=True)
+        (content_dir / "index.md").write_bytes(index_md)
+
+        # Ensure output directory exists (empty)
+        (site_root / "output").mkdir(parents=True, exist_ok=True)
 
-    # Ensure output directory exists (empty)
-    (site_root / "output").mkdir(parents=True, exist_ok=True)
+        # Re-raise any copy error
+        theme_copy.result()
 
     return site_root
@@ -4,9 +4,6 @@ if __name__ == "__main__":
     """CLI entry: run the TUI application or handle CLI commands."""
     import argparse
     from pathlib import Path
-    from site_generator import generate_site
-    from initialization import initialize_site
-    from ui import SSGApp
 
     parser = argparse.ArgumentParser(description="Gio's static site generator")
     parser.add_argument(
@@ -28,7 +25,10 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Import only what the chosen mode needs; the TUI pulls in Textual
     if args.generate:
+        from site_generator import generate_site
+
         folder = Path(args.generate)
         if not folder.exists():
             print(f"Error: Folder {folder} does not exist.")
@@ -37,6 +37,8 @@ if __name__ == "__main__":
         generate_site(folder)
         print("Site generation complete.")
     elif args.initialize:
+        from initialization import initialize_site
+
         folder_name = args.initialize
         site_name = folder_name.replace("_", " ").replace("-", " ").title()
         print(f"Initializing site '{site_name}' in folder {folder_name}...")
@@ -44,4 +46,6 @@ if __name__ == "__main__":
         print(f"Site initialized at {site_root}")
     else:
         # No arguments provided, run TUI
+        from ui import SSGApp
+
         SSGApp().run()
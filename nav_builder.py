@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path, PurePath
-from typing import List, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+import html
+import multiprocessing
 import os
+import posixpath
+import re
 
 import frontmatter  # type: ignore
+import yaml  # type: ignore  # installed with python-frontmatter
 
 try:
     from i18n import translate
@@ -24,22 +32,128 @@ class NavNode:
     rel_output_path: Path  # Relative path from output root (for both files and dirs)
     is_dir: bool  # True if this node represents a directory
     children: List["NavNode"]
+    # POSIX forms of the paths above, computed once for sidebar rendering
+    rel_content_posix: str = field(init=False, repr=False, compare=False)
+    rel_output_posix: str = field(init=False, repr=False, compare=False)
+    # Escaped forms emitted into the sidebar: HTML-escaped text and attribute
+    # values, and URL-quoted path segments
+    name_html: str = field(init=False, repr=False, compare=False)
+    rel_output_attr: str = field(init=False, repr=False, compare=False)
+    rel_output_url_parts: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # First child page rendering to index.html (directories only), set once the tree is sorted
+    index_child: Optional["NavNode"] = field(default=None, init=False, repr=False, compare=False)
+    # Sidebar fragments of inactive nodes, keyed per output directory; only
+    # the root holds one (set by build_nav_tree), other nodes keep None
+    sidebar_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.rel_content_posix = self.rel_content_path.as_posix()
+        self.rel_output_posix = self.rel_output_path.as_posix()
+        self.name_html = html.escape(self.name, quote=False)
+        self.rel_output_attr = html.escape(self.rel_output_posix, quote=True)
+        self.rel_output_url_parts = tuple(quote(p) for p in self.rel_output_posix.split("/"))
+
+
+def _walk_md(
+    root: Path,
+    dirs: Optional[List[Path]] = None,
+    sort_entries: bool = False,
+    blog_index_only: bool = False,
+) -> Iterator[Tuple[Path, str]]:
+    """Yield (absolute path, POSIX path relative to root) for each .md file under root.
+
+    Uses os.scandir so file/directory checks come from the directory entry
+    instead of a stat per path, and Path objects are only built for
+    markdown files. Like rglob, symlinked directories are never descended
+    into, so link cycles cannot recurse; symlinked .md files are still
+    yielded. When ``dirs`` is given, every subdirectory visited is
+    appended to it. ``sort_entries`` sorts each directory's entries by name
+    so the traversal order is stable across filesystems. ``blog_index_only``
+    skips everything but index.md inside ``_blog`` directories.
+    """
+    # Depth-first pre-order like rglob: a directory's files, then its subtrees
+    stack: List[Tuple[str, str, bool]] = [(str(root), "", False)]
+    while stack:
+        dir_path, rel_dir, in_blog = stack.pop()
+        subdirs: List[Tuple[str, str, bool]] = []
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name) if sort_entries else list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, rel, in_blog or (blog_index_only and entry.name == "_blog")))
+                if dirs is not None:
+                    dirs.append(Path(entry.path))
+            elif in_blog and entry.name != "index.md":
+                continue
+            elif entry.name.lower().endswith(".md") and entry.is_file():
+                yield Path(entry.path), rel
+        stack.extend(reversed(subdirs))
 
 
-def discover_markdown_files(content_root: Path) -> List[Path]:
-    """Recursively collect all Markdown files under a content root.
+def discover_markdown_files(content_root: Path) -> Iterator[Path]:
+    """Recursively yield all Markdown files under a content root.
+
+    Files are produced lazily while the tree is walked; wrap the result in
+    list() when it needs to be counted or extended.
 
     Args:
         content_root: Path to the content directory.
 
-    Returns:
-        List of absolute paths to .md files.
+    Yields:
+        Absolute paths to .md files.
+    """
+    for path, _ in _walk_md(content_root):
+        yield path
+
+
+# Same delimiter rule python-frontmatter uses for YAML blocks
+_FM_BOUNDARY = re.compile(rb"^-{3,}\s*$", re.MULTILINE)
+_FM_CHUNK = 4096
+_FM_MAX_BYTES = 64 * 1024
+# libyaml's C loader when PyYAML was built with it, as python-frontmatter picks
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_frontmatter_only(md_path: Path) -> Optional[dict[str, Any]]:
+    """Parse the YAML frontmatter block without reading the markdown body.
+
+    Reads the file in small chunks until the closing ``---`` line (up to
+    64 KB). Returns the metadata dict, ``{}`` when the file has no
+    frontmatter, or None when the quick path can't decide (TOML/JSON
+    frontmatter, BOM, unterminated or oversized block) and the caller
+    should fall back to ``frontmatter.load``.
     """
-    files: List[Path] = []
-    for path in content_root.rglob("*.md"):
-        if path.is_file():
-            files.append(path)
-    return files
+    with open(md_path, "rb") as f:
+        buf = f.read(_FM_CHUNK)
+        eof = len(buf) < _FM_CHUNK
+        head = buf.lstrip()
+        if not head:
+            return {} if eof else None
+        opening = _FM_BOUNDARY.match(buf)
+        if opening is None:
+            # Indented/BOM-prefixed delimiters and other formats go the slow way
+            if head.startswith((b"---", b"+++", b"{", b"\xef\xbb\xbf")):
+                return None
+            return {}
+
+        pos = opening.end()
+        while True:
+            closing = _FM_BOUNDARY.search(buf, pos)
+            # A match ending exactly at the buffer edge may continue in the next chunk
+            if closing is not None and (eof or closing.end() < len(buf)):
+                break
+            if eof or len(buf) >= _FM_MAX_BYTES:
+                return None
+            chunk = f.read(_FM_CHUNK)
+            eof = len(chunk) < _FM_CHUNK
+            buf += chunk
+
+    data = yaml.load(buf[opening.end():closing.start()].decode("utf-8"), Loader=_YAML_LOADER)
+    return data if isinstance(data, dict) else {}
 
 
 def load_title_from_markdown(md_path: Path) -> tuple[str, bool]:
@@ -64,21 +178,77 @@ def load_title_from_markdown(md_path: Path) -> tuple[str, bool]:
             title = translate("blog_title")
         return title, False
 
+    return _load_title_cached(os.path.abspath(md_path))
+
+
+# Absolute markdown path -> (title, is_draft), valid for the current build
+_title_cache: dict[str, tuple[str, bool]] = {}
+
+# Below this many unparsed files, worker start-up costs more than it saves
+_TITLE_POOL_MIN = 256
+
+
+def _load_title_cached(path_str: str) -> tuple[str, bool]:
+    """Return title and draft flag of a markdown file, memoized per absolute path."""
     try:
-        post = frontmatter.load(md_path)
-        title = post.metadata.get("title")
+        return _title_cache[path_str]
+    except KeyError:
+        result = _title_cache[path_str] = _parse_title(path_str)
+        return result
+
+
+def _parse_title(path_str: str) -> tuple[str, bool]:
+    """Parse title and draft flag of a markdown file (process pool worker)."""
+    md_path = Path(path_str)
+    try:
+        metadata = _read_frontmatter_only(md_path)
+        if metadata is None:
+            metadata = frontmatter.load(md_path).metadata
+        title = metadata.get("title")
         if isinstance(title, str) and title.strip():
             title = title.strip()
         else:
             title = md_path.stem.replace("_", " ").replace("-", " ")
-        is_draft = bool(post.metadata.get("draft"))
+        is_draft = bool(metadata.get("draft"))
         return title, is_draft
     except Exception:
         title = md_path.stem.replace("_", " ").replace("-", " ")
         return title, False
 
 
-def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
+def clear_title_cache() -> None:
+    """Forget memoized markdown titles (call before each site build)."""
+    _title_cache.clear()
+
+
+def _prefetch_titles(paths: List[Path], workers: Optional[int] = None) -> None:
+    """Parse titles of many markdown files in parallel into the title cache.
+
+    Frontmatter parsing is CPU-bound, so large sites spread it over worker
+    processes. Small batches, or any failure to start the pool, leave the
+    files to be parsed lazily in this process.
+
+    Args:
+        paths: Markdown files whose titles the nav tree needs.
+        workers: Maximum number of worker processes (defaults to the CPU count).
+    """
+    pending = [p for p in map(os.path.abspath, paths) if p not in _title_cache]
+    if len(pending) < _TITLE_POOL_MIN:
+        return
+    workers = workers or os.cpu_count() or 1
+    if workers < 2:
+        return
+    try:
+        # spawn: the TUI runs generation next to its own threads, which fork would copy mid-state
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            chunk = max(1, len(pending) // (workers * 4))
+            for path_str, result in zip(pending, pool.map(_parse_title, pending, chunksize=chunk)):
+                _title_cache[path_str] = result
+    except (OSError, BrokenProcessPool):
+        pass  # Anything not parsed yet is loaded on demand
+
+
+def build_nav_tree(content_root: Path, output_root: Path, workers: Optional[int] = None) -> NavNode:
     """Build a navigation tree reflecting content/ directory structure.
 
     Each markdown file is mapped to its future output HTML path.
@@ -86,47 +256,55 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
     Args:
         content_root: Path to content/ directory.
         output_root: Path to output/ directory.
+        workers: Maximum number of processes used to parse titles (defaults
+            to the CPU count).
 
     Returns:
         Root NavNode representing the content root.
     """
-    # Map directories to node - cache to avoid recreating nodes
-    dir_nodes: dict[Path, NavNode] = {}
+    # Map directories to node - cache to avoid recreating nodes. Keys are
+    # POSIX paths relative to content_root ("" for the root), which hash far
+    # cheaper than Path objects
+    dir_nodes: dict[str, NavNode] = {}
 
-    def get_dir_node(dir_path: Path) -> NavNode:
+    def get_dir_node(rel_dir: str) -> NavNode:
         # Lazy creation of directory nodes with caching
-        if dir_path not in dir_nodes:
-            name = dir_path.name or "Home"
-            rel_content = dir_path.relative_to(content_root)
+        node = dir_nodes.get(rel_dir)
+        if node is None:
+            parent_rel, _, name = rel_dir.rpartition("/")
+            name = name or content_root.name or "Home"
+            rel_content = Path(rel_dir)
             rel_output = rel_content
             # For directories, output path is the directory itself, not an index.html
             # This is important for determining active state of a directory
-            dir_nodes[dir_path] = NavNode(
+            node = dir_nodes[rel_dir] = NavNode(
                 name=name,
                 rel_content_path=rel_content,
                 rel_output_path=rel_output,
                 is_dir=True,
                 children=[],
             )
-        return dir_nodes[dir_path]
+            # Attach to the parent as soon as the node exists, creating
+            # missing ancestors on the way up
+            if rel_dir:
+                get_dir_node(parent_rel).children.append(node)
+        return node
 
     # Ensure root node exists
-    root_node = get_dir_node(content_root)
+    root_node = get_dir_node("")
+    root_node.sidebar_cache = {}
 
     # First pass: Walk filesystem and create nodes for all Markdown files
-    for path in sorted(content_root.rglob("*")):
-        if path.is_dir():
-            # Directories are handled by get_dir_node when their children or themselves are processed
-            continue
-        if path.suffix.lower() != ".md":
-            continue
-
-        rel_md = path.relative_to(content_root)
-        out_rel = rel_md.with_suffix(".html")
-
-        # Skip files inside _blog directories except index.md which should be navigable
-        if "_blog" in rel_md.parts and path.name != "index.md":
-            continue
+    # (directories are handled by get_dir_node; the walk also records them)
+    content_dirs: List[Path] = []
+    # Entries are sorted per directory, so no global sort of the tree is needed
+    # Only index.md is navigable inside _blog directories; the walker drops the posts
+    md_entries = list(_walk_md(content_root, content_dirs, sort_entries=True, blog_index_only=True))
+    _prefetch_titles([path for path, _ in md_entries], workers)
+    for path, rel_posix in md_entries:
+        # Swap the ".md" suffix (any case) on the string, not via with_suffix()
+        rel_md = Path(rel_posix)
+        out_rel = Path(rel_posix[:-3] + ".html")
 
         # Get title and draft status, skip if draft
         title, is_draft = load_title_from_markdown(path)
@@ -134,7 +312,7 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
             continue
 
         # Get or create parent directory node
-        parent_node = get_dir_node(path.parent)
+        parent_node = get_dir_node(rel_posix.rpartition("/")[0])
         # Create file node and attach to parent
         node = NavNode(
             name=title,
@@ -145,15 +323,6 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
         )
         parent_node.children.append(node)
 
-    # Second pass: Attach subdirectories under their parents
-    # This ensures directories are properly nested even when they contain no Markdown files
-    for dpath, node in list(dir_nodes.items()):
-        if dpath == content_root:
-            continue  # Skip root node
-        parent = get_dir_node(dpath.parent)
-        if node not in parent.children:
-            parent.children.append(node)
-
     # Sort children: directories first by name, then files by name
     def sort_key(n: NavNode) -> Tuple[int, str]:
         # Return tuple (priority, name) where directories have higher priority (0) than files (1)
@@ -161,6 +330,11 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
 
     def sort_tree(n: NavNode) -> None:
         n.children.sort(key=sort_key)
+        # Remember the index page so renderers need not search for it
+        n.index_child = next(
+            (c for c in n.children if not c.is_dir and c.rel_output_path.name == "index.html"),
+            None,
+        )
         # Recursively sort all child nodes
         for ch in n.children:
             sort_tree(ch)
@@ -170,8 +344,8 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
 
     # Add fake md paths for generated special pages
     special_md_paths = []
-    for special_dir in content_root.rglob("*"):
-        if special_dir.is_dir() and special_dir.name in {"_files", "_gallery", "_blog"}:
+    for special_dir in content_dirs:
+        if special_dir.name in {"_files", "_gallery", "_blog"}:
             index_md = special_dir / "index.md"
             if not index_md.exists():
                 has_content = False
@@ -194,7 +368,7 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
         out_rel = rel_md.with_suffix(".html")
         title, is_draft = load_title_from_markdown(fake_path)
         if not is_draft:
-            parent_node = get_dir_node(fake_path.parent)
+            parent_node = get_dir_node(rel_md.as_posix().rpartition("/")[0])
             node = NavNode(
                 name=title,
                 rel_content_path=rel_md,
@@ -204,18 +378,38 @@ def build_nav_tree(content_root: Path, output_root: Path) -> NavNode:
             )
             parent_node.children.append(node)
 
-    # Attach any newly created special directory nodes
-    for dpath, node in list(dir_nodes.items()):
-        if dpath == content_root:
-            continue  # Skip root node
-        parent = get_dir_node(dpath.parent)
-        if node not in parent.children:
-            parent.children.append(node)
-
     sort_tree(root_node)
     return root_node
 
 
+def _relative_url(target_parts: Tuple[str, ...], start_parts: Tuple[str, ...]) -> str:
+    """Return the '/'-joined relative path between two paths under the same root.
+
+    Equivalent to os.path.relpath for paths given as parts relative to a
+    shared root, without resolving or re-splitting them on every call.
+    """
+    common = 0
+    limit = min(len(target_parts), len(start_parts))
+    while common < limit and target_parts[common] == start_parts[common]:
+        common += 1
+    rel = [".."] * (len(start_parts) - common)
+    rel.extend(target_parts[common:])
+    return "/".join(rel) or "."
+
+
+def _posix_relpath(target: Path, start: Path) -> str:
+    """Relative URL from start to target, computed on POSIX forms of both paths."""
+    return posixpath.relpath(target.as_posix(), start.as_posix())
+
+
+def _parts_under(path: Path, root: Path) -> Optional[Tuple[str, ...]]:
+    """Return path's parts relative to root, or None if it is outside root."""
+    try:
+        return path.relative_to(root).parts
+    except ValueError:
+        return None
+
+
 def render_sidebar_html(
     node: NavNode,
     current_out_dir: Path,
@@ -231,6 +425,8 @@ def render_sidebar_html(
     - Directory labels link to index.html (if present) without duplicating it.
     - Show pages inside a directory ONLY when we are on that directory's index page.
     - Root index is not duplicated (covered by Home).
+    - Only HTML pages carry a sidebar: a current_out_rel that does not end in
+      .html (feeds, sitemaps, JSON) yields an empty string.
 
     Args:
     - node: Root of the navigation tree.
@@ -240,72 +436,89 @@ def render_sidebar_html(
     - is_multilingual: Whether the site is multilingual.
     - root_output: Root output directory for multilingual sites.
     """
+    # Stringify the current page path once rather than per visited node
+    current_out_posix = current_out_rel.as_posix() if current_out_rel is not None else None
+    if current_out_posix is not None and not current_out_posix.endswith(".html"):
+        return ""
 
     def rel_href(target: Path) -> str:
         # Calculate relative href from current page location to target
         try:
-            href = os.path.relpath(target, start=current_out_dir)
+            href = _posix_relpath(target, current_out_dir)
         except Exception:
-            href = str(target)
-        return href.replace(os.sep, "/")
+            href = target.as_posix()
+        return quote(href)
+
+    # Every sidebar target lives under output_root, so links are computed
+    # from the current directory's parts instead of calling relpath per item;
+    # both sides are compared in their URL-quoted form
+    current_parts = _parts_under(current_out_dir, output_root)
+    if current_parts is not None:
+        current_parts = tuple(quote(p) for p in current_parts)
+
+    def out_href(n: NavNode) -> str:
+        if current_parts is None:
+            return rel_href(output_root / n.rel_output_path)
+        return _relative_url(n.rel_output_url_parts, current_parts)
 
     def is_active_node(n: NavNode) -> bool:
         # Determine if a navigation node should be highlighted as active
-        if current_out_rel is None:
+        if current_out_posix is None:
             return False
         if n.is_dir:
             # A directory is active if the current page's output path starts with or is equal to the directory's output path
-            return current_out_rel.as_posix().startswith(n.rel_output_path.as_posix())
+            return current_out_posix.startswith(n.rel_output_posix)
         else:
             # A file is active if its output path exactly matches the current page's output path
-            return n.rel_output_path.as_posix() == current_out_rel.as_posix()
+            return n.rel_output_posix == current_out_posix
+
+    # Inactive items render the same for every page in a directory, so their
+    # HTML is cached on the tree; only the active chain is rendered per page
+    cache = node.sidebar_cache
+    if cache is None:
+        cache = node.sidebar_cache = {}
 
-    def render_file(f: NavNode) -> str:
+    def write_file(buf: List[str], f: NavNode) -> None:
         # Render a single file navigation item
-        label = f.name
-        target = output_root / f.rel_output_path
-        href = rel_href(target)
-        active = is_active_node(f)
-        cls = ' class="active"' if active else ''
-        return f'<li><a href="{href}"{cls}>{label}</a></li>'
-
-    def render_dir(d: NavNode) -> str:
+        if is_active_node(f):
+            buf.append(f'<li><a href="{out_href(f)}" class="active">{f.name_html}</a></li>')
+            return
+        cache_key = ("file", f.rel_output_posix, current_out_dir, output_root)
+        item = cache.get(cache_key)
+        if item is None:
+            item = cache[cache_key] = f'<li><a href="{out_href(f)}">{f.name_html}</a></li>'
+        buf.append(item)
+
+    def write_dir(buf: List[str], d: NavNode) -> None:
         # Render a directory navigation item with optional expansion
-        # Find index child if present to use its title and link
-        index_child = next(
-            (c for c in d.children if not c.is_dir and c.rel_output_path.name == "index.html"),
-            None,
-        )
+        if is_active_node(d):
+            write_dir_item(buf, d, True)
+            return
+        # An inactive directory is never the current page's own directory, so
+        # its collapsed markup only depends on where the current page lives
+        cache_key = ("dir", d.rel_output_posix, current_out_dir, output_root)
+        item = cache.get(cache_key)
+        if item is None:
+            part: List[str] = []
+            write_dir_item(part, d, False)
+            item = cache[cache_key] = "".join(part)
+        buf.append(item)
+
+    def write_dir_item(buf: List[str], d: NavNode, active_dir: bool) -> None:
+        # Index child, if present, provides the title and link
+        index_child = d.index_child
         # Use index child title if available, otherwise directory name
-        label = index_child.name if index_child else d.name
+        label = index_child.name_html if index_child else d.name_html
         # For directories, href should be relative to the index child, but if no index_child, no href
         if index_child:
             # Check if this directory's index is the same as the current page - if so, no need for link (for details show/hide)
             if index_child.rel_output_path == current_out_rel:
                 href = None  # No self-link for current page
             else:
-                href = rel_href(output_root / index_child.rel_output_path)
+                href = out_href(index_child)
         else:
             href = None
 
-        active_dir = is_active_node(d)
-
-        sub_items: List[str] = []
-        # Only render children if the directory is active (current directory)
-        if active_dir:
-            for c in d.children:
-                if c.is_dir:
-                    sub_items.append(render_dir(c))
-                else:
-                    # Exclude the index.html from the direct children list if it exists
-                    if index_child is not None and c.rel_output_path == index_child.rel_output_path:
-                        continue
-                    sub_items.append(render_file(c))
-
-        inner_ul = f"<ul>{''.join(sub_items)}</ul>" if sub_items else ""
-        # Use HTML details/summary for expandable directory
-        open_attr = " open" if active_dir else ""
-
         # Add classes for XP tree-view styling
         dir_classes = ["dir"]
         if d.children:  # If has children
@@ -314,35 +527,77 @@ def render_sidebar_html(
         if active_dir:  # If expanded
             dir_classes.append("expanded")
         class_attr = " ".join(dir_classes)
+        # Use HTML details/summary for expandable directory
+        open_attr = " open" if active_dir else ""
+        buf.append(f'<li class="{class_attr}"><details{open_attr}>')
 
         if href:
-            key = index_child.rel_output_path.as_posix() if index_child else d.rel_output_path.as_posix()
-            summary = f'<summary><a href="{href}" data-target="{key}"{(" class=\"active\"" if active_dir else "")}>{label}</a></summary>'
+            target = index_child.rel_output_attr if index_child else d.rel_output_attr
+            cls = ' class="active"' if active_dir else ""
+            buf.append(f'<summary><a href="{href}" data-target="{target}"{cls}>{label}</a></summary>')
         else:
-            summary = f"<summary><span>{label}</span></summary>"
-        return f'<li class="{class_attr}"><details{open_attr}>{summary}{inner_ul}</details></li>'
+            buf.append(f"<summary><span>{label}</span></summary>")
 
-    # Build top-level navigation list
-    items: List[str] = []
+        # Only render children if the directory is active (current directory)
+        if active_dir:
+            buf.append("<ul>")
+            mark = len(buf)
+            for c in d.children:
+                if c.is_dir:
+                    write_dir(buf, c)
+                else:
+                    # Exclude the index.html from the direct children list if it exists
+                    if index_child is not None and c.rel_output_posix == index_child.rel_output_posix:
+                        continue
+                    write_file(buf, c)
+            if len(buf) == mark:
+                buf.pop()  # No sub items: drop the empty list
+            else:
+                buf.append("</ul>")
+        buf.append("</details></li>")
+
+    # Build the whole sidebar into one buffer and join once
+    buf: List[str] = ["<ul>"]
     # Add Home link first
     if is_multilingual and root_output != output_root:
         home_target = root_output / "index.html"
     else:
         home_target = output_root / "index.html"
-    home_active = bool(current_out_rel and current_out_rel.as_posix() == "index.html")
+    home_active = current_out_posix == "index.html"
     home_cls = ' class="active"' if home_active else ''
-    items.append(f'<li><a href="{rel_href(home_target)}"{home_cls}>Home</a></li>')
+    buf.append(f'<li><a href="{rel_href(home_target)}"{home_cls}>Home</a></li>')
 
     # Then render root children, excluding the root index page to avoid duplicate Home
     for ch in node.children:
         if not ch.is_dir and ch.rel_output_path.name == "index.html":
             continue  # Skip root index.html to avoid duplicating Home
         if ch.is_dir:
-            items.append(render_dir(ch))
+            write_dir(buf, ch)
         else:
-            items.append(render_file(ch))
+            write_file(buf, ch)
+
+    buf.append("</ul>")
+    return "".join(buf)
+
+
+# content_root -> {directory parts: index.md path or None}, filled lazily per build
+_index_md_cache: dict[str, dict[Tuple[str, ...], Optional[Path]]] = {}
+
 
-    return f"<ul>{''.join(items)}</ul>"
+def _index_md_for(content_root: Path, parts: Tuple[str, ...]) -> Optional[Path]:
+    """Return the index.md of a content directory if it exists, memoized."""
+    per_root = _index_md_cache.setdefault(str(content_root), {})
+    try:
+        return per_root[parts]
+    except KeyError:
+        idx = content_root.joinpath(*parts, "index.md")
+        found = per_root[parts] = idx if idx.exists() else None
+        return found
+
+
+def clear_breadcrumb_cache() -> None:
+    """Forget memoized index.md lookups (call before each site build)."""
+    _index_md_cache.clear()
 
 
 def build_breadcrumbs(
@@ -352,6 +607,7 @@ def build_breadcrumbs(
     current_out_dir: Path,
     is_multilingual: bool = False,
     root_output: Path = None,
+    home_title: Optional[str] = None,
 ) -> List[dict[str, Optional[str]]]:
     """Build breadcrumbs for the current page.
 
@@ -365,6 +621,8 @@ def build_breadcrumbs(
         current_out_dir: Output directory of the current HTML page.
         is_multilingual: Whether the site is multilingual.
         root_output: Root output directory for multilingual sites.
+        home_title: Title of content/index.md when the caller already knows it
+            exists; avoids looking the home page up again for every page.
 
     Returns:
         List of dicts with keys: label, url (None for current segment or missing index).
@@ -378,35 +636,45 @@ def build_breadcrumbs(
         effective_root = root_output
 
     # Home (use title from content/index.md if available)
-    home_index = content_root / "index.md"
-    if home_index.exists():
+    if home_title is None:
+        home_index = _index_md_for(content_root, ())
+        if home_index is not None:
+            home_title, _ = load_title_from_markdown(home_index)
+    if home_title is not None:
         if is_multilingual:
             # For multilingual, home is the root language selector
             target = effective_root / "index.html"
         else:
             # For monolingual, home is the site root
             target = output_root / "index.html"
-        try:
-            url = os.path.relpath(target, start=current_out_dir).replace(os.sep, "/")
-        except Exception:
-            url = "index.html"
-        home_title, _ = load_title_from_markdown(home_index)
+        home_parts = _parts_under(current_out_dir, target.parent)
+        if home_parts is not None:
+            url = _relative_url(("index.html",), home_parts)
+        else:
+            try:
+                url = _posix_relpath(target, current_out_dir)
+            except Exception:
+                url = "index.html"
         home_label = home_title or "Home"
         crumbs.append({"label": home_label, "url": url})
     else:
         crumbs.append({"label": "Home", "url": None})
 
     parts = list(rel_md_path.parts)
+    # Crumb targets all live under output_root; relate them to the current dir once
+    current_parts = _parts_under(current_out_dir, output_root)
     # Remove the filename part for intermediate dirs
     for i in range(len(parts) - 1):
-        d = content_root.joinpath(*parts[: i + 1])
-        idx = d / "index.md"
-        if idx.exists():
-            target_html = output_root.joinpath(*parts[: i + 1], "index.html")
-            try:
-                url = os.path.relpath(target_html, start=current_out_dir).replace(os.sep, "/")
-            except Exception:
-                url = (Path(*parts[: i + 1]) / "index.html").as_posix()
+        idx = _index_md_for(content_root, tuple(parts[: i + 1]))
+        if idx is not None:
+            if current_parts is not None:
+                url = _relative_url((*parts[: i + 1], "index.html"), current_parts)
+            else:
+                target_html = output_root.joinpath(*parts[: i + 1], "index.html")
+                try:
+                    url = _posix_relpath(target_html, current_out_dir)
+                except Exception:
+                    url = (Path(*parts[: i + 1]) / "index.html").as_posix()
             label_title, _ = load_title_from_markdown(idx)
             label = label_title
         else:
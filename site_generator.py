@@ -2,44 +2,90 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from html import escape as html_escape, unescape as html_unescape
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import io
 import json
+import multiprocessing
 import os
+import pickle
+import queue
 import re
 import shutil
+import threading
 import time
 
 import frontmatter  # type: ignore
 import markdown  # type: ignore
-from jinja2 import Template, Environment, FileSystemLoader  # type: ignore
+from jinja2 import Template, Environment, FileSystemBytecodeCache, FileSystemLoader  # type: ignore
 try:
     from PIL import Image, ImageOps  # type: ignore
 except Exception:
     Image = None  # type: ignore
     ImageOps = None  # type: ignore
+try:
+    from PIL import ImageCms  # type: ignore  # needs Pillow built with littlecms
+except Exception:
+    ImageCms = None  # type: ignore
+try:
+    import pillow_avif  # type: ignore  # noqa: F401  # registers AVIF with Pillow < 11.3
+except Exception:
+    pillow_avif = None  # type: ignore
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+try:
+    from blake3 import blake3  # type: ignore
+except Exception:
+    blake3 = None  # type: ignore
+try:
+    from markdown_it import MarkdownIt  # type: ignore
+except Exception:
+    MarkdownIt = None  # type: ignore
+try:
+    from mdit_py_plugins.anchors import anchors_plugin  # type: ignore
+    from mdit_py_plugins.deflist import deflist_plugin  # type: ignore
+    from mdit_py_plugins.footnote import footnote_plugin  # type: ignore
+except Exception:
+    anchors_plugin = deflist_plugin = footnote_plugin = None  # type: ignore
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except Exception:
+    try:
+        from selectolax.parser import HTMLParser  # type: ignore  # selectolax < 1.0
+    except Exception:
+        HTMLParser = None  # type: ignore
 
 try:
     from config import SiteConfig, read_config, sanitize_path
     from i18n import translate, set_global_language
     from nav_builder import (
         NavNode,
-        discover_markdown_files,
         build_nav_tree,
         render_sidebar_html,
         build_breadcrumbs,
-        load_title_from_markdown
+        load_title_from_markdown,
+        clear_title_cache,
+        clear_breadcrumb_cache,
     )
 except ImportError:
     from .config import SiteConfig, read_config, sanitize_path
     from .i18n import translate, set_global_language
     from .nav_builder import (
         NavNode,
-        discover_markdown_files,
         build_nav_tree,
         render_sidebar_html,
         build_breadcrumbs,
-        load_title_from_markdown
+        load_title_from_markdown,
+        clear_title_cache,
+        clear_breadcrumb_cache,
     )
 
 
@@ -47,33 +93,213 @@ except ImportError:
 UILog = Any
 
 
-def convert_markdown_to_html(md_text: str) -> str:
-    """Convert Markdown text to HTML using Python-Markdown."""
-    return markdown.markdown(md_text, extensions=["extra", "toc", "sane_lists"])
+# One converter per thread: building a Markdown instance loads and registers
+# every extension, which costs more than converting a typical page. Instances
+# keep per-document state, so threads (e.g. the TUI's worker) get their own.
+_md_local = threading.local()
+
+
+def _markdown_converter() -> markdown.Markdown:
+    """This thread's shared Markdown instance, created on first use."""
+    md = getattr(_md_local, "md", None)
+    if md is None:
+        md = _md_local.md = markdown.Markdown(extensions=["extra", "toc", "sane_lists"])
+    return md
+
+
+# markdown-it-py parser when config selects it (stateless per render, so one
+# instance serves every thread); None means Python-Markdown
+_markdown_it: Optional[Any] = None
+
+
+def set_markdown_engine(engine: str) -> bool:
+    """Select the converter used by convert_markdown_to_html.
+
+    Args:
+        engine: "python-markdown" or "markdown-it".
+
+    Returns:
+        False if markdown-it was requested but markdown-it-py is not
+        installed; Python-Markdown is used instead.
+    """
+    global _markdown_it
+    _markdown_it = None
+    if engine != "markdown-it":
+        return True
+    if MarkdownIt is None:
+        return False
+    md = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+    if anchors_plugin is not None:
+        # Heading ids, deflists and footnotes stand in for toc and extra
+        md.use(anchors_plugin, max_level=6).use(deflist_plugin).use(footnote_plugin)
+    _markdown_it = md
+    return True
+
+
+# Rendered Markdown kept across builds (set by set_markdown_cache_dir), one
+# <digest>.html file per distinct source text; None disables it
+_md_cache_dir: Optional[Path] = None
+
+# Least recently read cache files are dropped past this many bytes
+_MD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def set_markdown_cache_dir(cache_dir: Optional[Path]) -> None:
+    """Keep rendered Markdown under cache_dir (None: always convert)."""
+    global _md_cache_dir
+    _md_cache_dir = None
+    if cache_dir is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _md_cache_dir = cache_dir
+        except OSError:
+            pass
+
+
+def markdown_digest(md_text: str) -> str:
+    """Cache key for md_text under the active engine."""
+    h = hashlib.blake2b(b"markdown-it\0" if _markdown_it is not None else b"python-markdown\0", digest_size=16)
+    h.update(md_text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _md_cache_get(digest: str) -> Optional[str]:
+    try:
+        return (_md_cache_dir / f"{digest}.html").read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _md_cache_put(digest: str, html: str) -> None:
+    path = _md_cache_dir / f"{digest}.html"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(html.encode("utf-8"))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def prune_markdown_cache(max_bytes: int = _MD_CACHE_MAX_BYTES) -> None:
+    """Delete the least recently read cached renders beyond max_bytes."""
+    if _md_cache_dir is None:
+        return
+    entries = []
+    total = 0
+    try:
+        with os.scandir(_md_cache_dir) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_atime_ns, st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+def convert_markdown_to_html(md_text: str, digest: Optional[str] = None) -> str:
+    """Convert Markdown text to HTML using the configured engine.
+
+    With a cache directory set, a text converted by an earlier build is
+    read back instead of parsed again.
+
+    Args:
+        md_text: Markdown source.
+        digest: markdown_digest(md_text), if the caller already has it.
+    """
+    if _md_cache_dir is not None:
+        digest = digest or markdown_digest(md_text)
+        html = _md_cache_get(digest)
+        if html is not None:
+            return html
+    if _markdown_it is not None:
+        html = _markdown_it.render(md_text)
+    else:
+        html = _markdown_converter().reset().convert(md_text)
+    if _md_cache_dir is not None:
+        _md_cache_put(digest, html)
+    return html
+
+
+# Repository checkout: holds the fallback templates and assets
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def _up_prefix(out_dir: Path, root: Path) -> str:
+    """Relative URL prefix leading from out_dir back up to root ("../" per level).
+
+    Pages link root-level assets (theme CSS, common.js, gallery files) as
+    prefix + file name, which is what os.path.relpath would return.
+    """
+    return "../" * len(out_dir.relative_to(root).parts)
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
 
 
 def strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace for search index content."""
-    # Remove tags
-    text = re.sub(r"<[^>]+>", " ", html)
-    # Unescape basic entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&", "&")
-    text = text.replace("<", "<")
-    text = text.replace(">", ">")
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    """Remove HTML tags and collapse whitespace for search index content.
+
+    Markup characters stay escaped (the search box inserts snippets as HTML).
+    Uses selectolax's C parser when installed, else a regex pass.
+    """
+    if HTMLParser is not None:
+        text = HTMLParser(html).text(separator=" ")
+        return html_escape(" ".join(text.split()), quote=False)
+    # Remove tags, then decode entities so the result matches the parser path
+    text = html_unescape(_TAG_RE.sub(" ", html))
+    # Collapse whitespace (\xa0 from &nbsp; included); str.split trims the
+    # ends in the same pass and splits on exactly what \s matches
+    return html_escape(" ".join(text.split()), quote=False)
+
+
+# One Environment per template directory: Jinja keeps each parsed template.
+# The environments are dropped at the start of every build (see
+# set_template_cache_dir), so they skip Jinja's per-use mtime check, which
+# otherwise stats every {% include %}d partial on every page render.
+_template_envs: Dict[Path, Environment] = {}
+_bytecode_cache: Optional[FileSystemBytecodeCache] = None
+
+
+def set_template_cache_dir(cache_dir: Optional[Path]) -> None:
+    """Persist compiled templates under cache_dir (None: in memory only).
+
+    Jinja keys the cached bytecode on the template source, so edited
+    templates are recompiled rather than served stale. Also drops the
+    loaded environments, so each build starts from the files on disk.
+    """
+    global _bytecode_cache
+    _bytecode_cache = None
+    if cache_dir is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except OSError:
+            pass
+    _template_envs.clear()
 
 
 def load_template(theme_path: Path, assets_dir: Path = None) -> Template:
     """Load a Jinja2 template from a file path, with loader if assets_dir provided."""
-    if assets_dir:
-        loader = FileSystemLoader(assets_dir)
-        env = Environment(loader=loader)
-        return env.get_template(theme_path.name)
-    else:
-        return Template(theme_path.read_text(encoding="utf-8"))
+    search_dir = assets_dir if assets_dir else theme_path.parent
+    env = _template_envs.get(search_dir)
+    if env is None:
+        env = Environment(loader=FileSystemLoader(search_dir), bytecode_cache=_bytecode_cache, auto_reload=False)
+        _template_envs[search_dir] = env
+    return env.get_template(theme_path.name)
 
 
 def copy_assets(site_root: Path, output_root: Path) -> None:
@@ -83,7 +309,6 @@ def copy_assets(site_root: Path, output_root: Path) -> None:
     - Falls back to repository defaults if the site doesn't provide them.
     """
     try:
-        REPO_ROOT = Path(__file__).resolve().parent
         repo_assets = REPO_ROOT / "assets"
         src = site_root / "assets"
         for fname in ("gallery.css", "gallery.js", "common.js"):
@@ -99,20 +324,163 @@ def copy_assets(site_root: Path, output_root: Path) -> None:
         pass
 
 
-def copy_non_markdown_files(content_root: Path, output_root: Path, log: Optional[UILog] = None) -> None:
-    """Copy all non-Markdown files from content_root to output_root, preserving structure."""
+# Directory names that generate listings instead of plain pages
+SPECIAL_DIRS = {"_files", "_gallery", "_blog"}
+
+
+@dataclass
+class _ContentScan:
+    """Everything a build needs from one walk of a content tree."""
+
+    # .md files, as discover_markdown_files yields them
+    md_files: List[Path] = field(default_factory=list)
+    # (absolute path, path relative to the root) of every other file
+    static_files: List[Tuple[str, Path]] = field(default_factory=list)
+    # _files/_gallery/_blog directories
+    special_dirs: List[Path] = field(default_factory=list)
+
+
+def _scan_content(root: Path) -> _ContentScan:
+    """Walk root once and sort its entries into a _ContentScan.
+
+    The order is depth-first pre-order like rglob: a directory's entries,
+    then its subtrees. File types come from the directory entry, so no stat
+    is made per path. Like rglob, symlinked directories are never descended
+    into, so link cycles cannot recurse; symlinked files are still kept.
+    """
+    scan = _ContentScan()
+    prefix_len = len(str(root)) + 1
+    stack: List[str] = [str(root)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    if entry.name in SPECIAL_DIRS:
+                        scan.special_dirs.append(Path(entry.path))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if entry.name.lower().endswith(".md"):
+                scan.md_files.append(Path(entry.path))
+            # Same suffix rule as Path.suffix: a bare ".md" name has no suffix
+            if os.path.splitext(entry.name)[1].lower() != ".md":
+                scan.static_files.append((entry.path, Path(entry.path[prefix_len:])))
+        stack.extend(reversed(subdirs))
+    return scan
+
+
+def _prefetch_texts(paths: List[Path], depth: int = 16) -> Iterator[Tuple[Path, Optional[str]]]:
+    """Yield (path, text) in order while a background thread reads ahead.
+
+    Overlaps file reads with the caller's parsing and rendering, which pays
+    off on slow or network disks. Files are read in text mode, like
+    frontmatter.load does; unreadable ones yield None so the caller can
+    open them itself and report the error.
+    """
+    buf: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        for path in paths:
+            try:
+                text: Optional[str] = path.read_text(encoding="utf-8")
+            except (OSError, ValueError):
+                text = None
+            while True:
+                if stop.is_set():
+                    return
+                try:
+                    buf.put((path, text), timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        for _ in range(len(paths)):
+            yield buf.get()
+    finally:
+        stop.set()
+
+
+def _fast_copy(src: str, dst: Path) -> None:
+    """Copy file contents like shutil.copyfile, in-kernel where possible.
+
+    On Linux os.copy_file_range moves the bytes without bouncing them
+    through userspace (and may reflink on btrfs/xfs). Filesystems or
+    kernels that refuse it (ENOSYS, EXDEV, EINVAL, ...) fall back to
+    shutil.copyfile.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                if remaining <= 0:
+                    return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+# Static files are copied concurrently; the work is I/O bound
+_COPY_WORKERS = 8
+
+
+def copy_non_markdown_files(
+    content_root: Path,
+    output_root: Path,
+    log: Optional[UILog] = None,
+    files: Optional[List[Tuple[str, Path]]] = None,
+) -> None:
+    """Copy all non-Markdown files from content_root to output_root, preserving structure.
+
+    Args:
+        content_root: Content directory to copy from.
+        output_root: Directory receiving the files.
+        log: Optional log widget.
+        files: The static_files of a _scan_content(content_root) already
+            made; the tree is walked when omitted.
+    """
     def info(msg: str) -> None:
         if log is not None:
             log.write(msg)
         else:
             print(msg)
 
-    for src_file in content_root.rglob("*"):
-        if src_file.is_file() and src_file.suffix.lower() != ".md":
-            rel_path = src_file.relative_to(content_root)
-            dst_file = output_root / rel_path
+    if files is None:
+        files = _scan_content(content_root).static_files
+    made_dirs: set = set()
+    pairs: List[Tuple[str, Path]] = []
+    rel_paths: List[Path] = []
+    for src, rel_path in files:
+        dst_file = output_root / rel_path
+        if dst_file.parent not in made_dirs:
             dst_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(src_file, dst_file)
+            made_dirs.add(dst_file.parent)
+        pairs.append((src, dst_file))
+        rel_paths.append(rel_path)
+
+    if not pairs:
+        return
+
+    # map() yields in submission order, so the log reads as before
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as ex:
+        for _, rel_path in zip(ex.map(lambda p: _fast_copy(*p), pairs), rel_paths):
             info(f"Copied static file: {rel_path}")
 
 
@@ -120,15 +488,138 @@ def copy_non_markdown_files(content_root: Path, output_root: Path, log: Optional
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
 
+def _has_file_with_suffix(dir_path: Path, suffixes: set) -> bool:
+    """Whether dir_path directly holds a file whose suffix (any case) is in suffixes."""
+    with os.scandir(dir_path) as it:
+        return any(os.path.splitext(e.name)[1].lower() in suffixes and e.is_file() for e in it)
+
+# Build caches live here, under the site root
+CACHE_DIR = Path(".ssg-cache")
+
+# Generated thumbnails are kept here across builds
+THUMB_CACHE_DIR = CACHE_DIR / "thumbs"
+
+# Galleries with fewer new thumbnails than this skip the thread pool
+_THUMB_POOL_MIN = 4
+
+# Compiled Jinja templates
+TEMPLATE_CACHE_DIR = CACHE_DIR / "jinja"
+
+# Rendered Markdown bodies
+MARKDOWN_CACHE_DIR = CACHE_DIR / "md"
+
+
+def _new_hasher() -> Any:
+    """Hash object for cache keys (BLAKE3 when installed, else BLAKE2b)."""
+    return blake3() if blake3 is not None else hashlib.blake2b(digest_size=16)
+
+
+def _read_json_dict(path: Path) -> Dict[str, Any]:
+    """Load a JSON object written by _write_json_atomic ({} if missing or invalid)."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write data as JSON under a private name, then rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(data))
+    else:
+        tmp.write_bytes(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+    os.replace(tmp, path)
+
+
+def _gallery_memo_path(cache_dir: Path, gallery_dir: Path) -> Path:
+    """File remembering the source digests of one gallery directory."""
+    name = hashlib.blake2b(os.path.abspath(gallery_dir).encode("utf-8"), digest_size=8).hexdigest()
+    return cache_dir / "galleries" / f"{name}.json"
+
+
+def _file_digest(path: Path) -> str:
+    """Hex digest of a file's bytes."""
+    h = _new_hasher()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:32]
+
+
+# thumb_format -> (file suffix, Pillow format, save options); "original"
+# keeps the source format and is handled by _thumb_spec
+_THUMB_ENCODINGS: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    "webp": (".webp", "WEBP", {"quality": 82, "method": 4}),
+    "avif": (".avif", "AVIF", {"quality": 60}),
+}
+
+
+# Bump when thumbnails change for reasons the encoder settings don't show
+_THUMB_REVISION = 2
+
+
+def _strip_thumb_metadata(im: Any) -> Any:
+    """Drop EXIF and ICC data from a thumbnail, converting it to sRGB first.
+
+    Orientation is already baked into the pixels and thumbnails need no
+    camera or GPS tags; an embedded profile can outweigh the image itself.
+    RGB(A) pixels are converted from their profile so wide-gamut photos
+    keep their colours once it is gone.
+    """
+    icc = im.info.pop("icc_profile", None)
+    im.info.pop("exif", None)
+    if icc and ImageCms is not None and im.mode in ("RGB", "RGBA"):
+        try:
+            src_profile = ImageCms.ImageCmsProfile(io.BytesIO(icc))
+            im = ImageCms.profileToProfile(im, src_profile, ImageCms.createProfile("sRGB"), outputMode=im.mode)
+            im.info.pop("icc_profile", None)
+        except Exception:
+            pass  # Unusable profile: keep the pixels as they are
+    return im
+
+
+def _thumb_spec(src_file: Path, thumb_format: str) -> Tuple[str, Optional[str], Dict[str, Any]]:
+    """Thumbnail file name, Pillow format (None: from the suffix) and save options."""
+    encoding = _THUMB_ENCODINGS.get(thumb_format)
+    if encoding is not None:
+        suffix, pil_format, save_kwargs = encoding
+        return src_file.stem + suffix, pil_format, save_kwargs
+    if src_file.suffix.lower() in {".jpg", ".jpeg"}:
+        return src_file.stem + ".jpg", None, {"quality": 85, "optimize": True}  # normalize extension
+    return src_file.name, None, {}
+
+
+def _thumb_format_supported(thumb_format: str) -> bool:
+    """Whether the installed Pillow can encode thumb_format."""
+    encoding = _THUMB_ENCODINGS.get(thumb_format)
+    if encoding is None:
+        return True
+    Image.init()
+    return encoding[1] in Image.SAVE
+
+
 def _gather_gallery_items(
     content_root: Path,
     gallery_dir: Path,
     output_root: Path,
     thumb_max_side: int,
     log: Optional[UILog] = None,
+    cache_dir: Optional[Path] = None,
+    thumb_format: str = "webp",
 ) -> list[dict[str, Any]]:
     """Prepare gallery items and generate thumbnails.
 
+    When ``cache_dir`` is given, thumbnails of unchanged images are copied
+    from it instead of being regenerated (the output directory is wiped on
+    every build, so mtimes alone never match). Source digests are
+    remembered per gallery by file name, mtime and size, so unchanged
+    images are not re-read just to be hashed. ``thumb_format`` is the
+    config's thumb_format; formats Pillow cannot write fall back to
+    "original".
+
     Returns list of dicts with keys: full (Path), thumb (Path), alt (str)
     Paths are absolute paths under output_root.
     """
@@ -143,15 +634,24 @@ def _gather_gallery_items(
         return items
 
     warned_no_pillow = False
+    if Image is not None and not _thumb_format_supported(thumb_format):
+        info(f"[Gallery] Pillow cannot write {thumb_format} thumbnails: keeping the source format.")
+        thumb_format = "original"
+    # (index into items, source image, thumbnail path, known digest, (mtime_ns, size))
+    # for thumbnails still to be generated
+    todo: List[Tuple[int, Path, Path, Optional[str], Tuple[int, int]]] = []
+    memo_path = _gallery_memo_path(cache_dir, gallery_dir) if cache_dir is not None and Image is not None else None
+    memo = _read_json_dict(memo_path) if memo_path is not None else {}
+    present: set = set()
 
     MAX_GALLERY_ITEMS = 1000
-    gallery_files = list(sorted(gallery_dir.iterdir()))[:MAX_GALLERY_ITEMS]
-    for src_file in gallery_files:
-        if not src_file.is_file():
-            continue
-        ext = src_file.suffix.lower()
-        if ext not in IMAGE_EXTS:
+    with os.scandir(gallery_dir) as it:
+        gallery_entries = sorted(it, key=lambda e: e.name)[:MAX_GALLERY_ITEMS]
+    for entry in gallery_entries:
+        # Filter on the DirEntry; only images become Path objects
+        if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTS or not entry.is_file():
             continue
+        src_file = Path(entry.path)
         # Output path for original (already copied by copy_non_markdown_files)
         try:
             rel_from_content = src_file.relative_to(content_root)
@@ -162,7 +662,7 @@ def _gather_gallery_items(
         # Thumbnail path: sibling directory "_thumbs"
         thumbs_dir = full_out.parent / "_thumbs"
         thumbs_dir.mkdir(parents=True, exist_ok=True)
-        thumb_out = thumbs_dir / src_file.name
+        thumb_out = thumbs_dir / _thumb_spec(src_file, thumb_format)[0]
 
         # Create/refresh thumbnail if Pillow available
         if Image is None:
@@ -173,29 +673,13 @@ def _gather_gallery_items(
         else:
             try:
                 # Regenerate if missing or source is newer
-                if (not thumb_out.exists()) or (src_file.stat().st_mtime > thumb_out.stat().st_mtime):
-                    with Image.open(src_file) as im:
-                        im = im.convert("RGB") if ext in {".jpg", ".jpeg"} else im
-                        # Auto-orient via EXIF
-                        try:
-                            if ImageOps is not None:
-                                im = ImageOps.exif_transpose(im)
-                        except Exception:
-                            pass
-                        # Create square center-cropped thumbnail to avoid letterboxing
-                        target = (thumb_max_side, thumb_max_side)
-                        try:
-                            im_thumb = ImageOps.fit(im, target, method=getattr(Image, "LANCZOS", Image.BICUBIC), centering=(0.5, 0.5))
-                        except Exception:
-                            # Fallback: preserve aspect ratio thumbnail (may cause bands in CSS-only layouts)
-                            im_thumb = im.copy()
-                            im_thumb.thumbnail(target)
-                        save_kwargs = {}
-                        if ext in {".jpg", ".jpeg"}:
-                            save_kwargs = {"quality": 85, "optimize": True}
-                            thumb_out = thumb_out.with_suffix(".jpg")  # normalize extension
-                        im_thumb.save(thumb_out, **save_kwargs)
-                        info(f"[Gallery] Thumbnail created: {thumb_out.relative_to(output_root)}")
+                st = entry.stat()
+                present.add(entry.name)
+                if (not thumb_out.exists()) or (st.st_mtime > thumb_out.stat().st_mtime):
+                    sig = (st.st_mtime_ns, st.st_size)
+                    known = memo.get(entry.name)
+                    digest = known[2] if isinstance(known, list) and len(known) == 3 and tuple(known[:2]) == sig else None
+                    todo.append((len(items), src_file, thumb_out, digest, sig))
             except Exception as e:
                 info(f"[Gallery] Error creating thumbnail for {src_file.name}: {e}")
                 thumb_out = full_out
@@ -203,9 +687,148 @@ def _gather_gallery_items(
         alt_text = src_file.stem.replace("_", " ").replace("-", " ")
         items.append({"full": full_out, "thumb": thumb_out, "alt": alt_text})
 
+    # Pillow releases the GIL while decoding, resampling and encoding, so
+    # thumbnails are built on a thread pool; results are logged in file order.
+    # Inside a page render worker the cores are already shared out between
+    # processes, so thumbnails are built inline there.
+    if todo:
+        def make(job: Tuple[int, Path, Path, Optional[str], Tuple[int, int]]) -> Tuple[Path, Optional[Exception], bool, Optional[str]]:
+            return _make_thumb(job[1], job[2], thumb_max_side, cache_dir, thumb_format, digest=job[3])
+
+        workers = min(len(todo), _cpu_budget())
+        if len(todo) < _THUMB_POOL_MIN or workers < 2 or _worker_page_state is not None:
+            results = [make(job) for job in todo]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(make, todo))
+        updated = {name: value for name, value in memo.items() if name in present}
+        for (index, src_file, _, _, sig), (thumb_out, error, cached, digest) in zip(todo, results):
+            if digest is not None:
+                updated[src_file.name] = [sig[0], sig[1], digest]
+            if error is None:
+                verb = "reused" if cached else "created"
+                info(f"[Gallery] Thumbnail {verb}: {thumb_out.relative_to(output_root)}")
+            else:
+                info(f"[Gallery] Error creating thumbnail for {src_file.name}: {error}")
+                thumb_out = items[index]["full"]
+            items[index]["thumb"] = thumb_out
+        if memo_path is not None and updated != memo:
+            try:
+                _write_json_atomic(memo_path, updated)
+            except OSError:
+                pass  # Best effort, like the thumbnail cache itself
+
     return items
 
 
+def _make_thumb(
+    src_file: Path,
+    thumb_out: Path,
+    thumb_max_side: int,
+    cache_dir: Optional[Path] = None,
+    thumb_format: str = "webp",
+    digest: Optional[str] = None,
+) -> Tuple[Path, Optional[Exception], bool, Optional[str]]:
+    """Write a square thumbnail of src_file (thread pool worker).
+
+    Thumbnails are looked up in / stored to ``cache_dir`` by a hash of the
+    source bytes (``digest`` when the caller already knows it), the
+    thumbnail size, the encoder settings and the output suffix.
+
+    Returns the path written (thumb_out, named by _thumb_spec), the error
+    raised if any, whether it came from the cache, and the source digest
+    (None when not computed).
+    """
+    ext = src_file.suffix.lower()
+    _, pil_format, save_kwargs = _thumb_spec(src_file, thumb_format)
+    cached: Optional[Path] = None
+    if cache_dir is not None:
+        key_ext = thumb_out.suffix.lower()
+        try:
+            if digest is None:
+                digest = _file_digest(src_file)
+            # Retuned encoder settings must not reuse the old files
+            settings = hashlib.blake2b(repr((_THUMB_REVISION, sorted(save_kwargs.items()))).encode("utf-8"), digest_size=4).hexdigest()
+            cached = cache_dir / f"{digest}_{thumb_max_side}_{settings}{key_ext}"
+            if cached.is_file():
+                shutil.copyfile(cached, thumb_out)
+                return thumb_out, None, True, digest
+        except OSError:
+            cached = None
+    try:
+        with Image.open(src_file) as im:
+            if ext in {".jpg", ".jpeg"}:
+                # Let libjpeg decode at 1/2..1/8 scale when the photo is much
+                # larger than needed; must happen before convert() loads it
+                im.draft("RGB", (thumb_max_side * 2, thumb_max_side * 2))
+                im = im.convert("RGB")
+            # Auto-orient via EXIF
+            try:
+                if ImageOps is not None:
+                    im = ImageOps.exif_transpose(im)
+            except Exception:
+                pass
+            # Create square center-cropped thumbnail to avoid letterboxing.
+            # Same crop as ImageOps.fit, but reducing_gap lets Pillow shrink
+            # by an integer factor with a cheap box filter first, so LANCZOS
+            # only runs over a buffer about twice the target size
+            target = (thumb_max_side, thumb_max_side)
+            try:
+                w, h = im.size
+                side = min(w, h)
+                box = ((w - side) / 2, (h - side) / 2, (w + side) / 2, (h + side) / 2)
+                im_thumb = im.resize(target, getattr(Image, "LANCZOS", Image.BICUBIC), box=box, reducing_gap=2.0)
+            except Exception:
+                # Fallback: preserve aspect ratio thumbnail (may cause bands in CSS-only layouts)
+                im_thumb = im.copy()
+                im_thumb.thumbnail(target)
+            im_thumb = _strip_thumb_metadata(im_thumb)
+            im_thumb.save(thumb_out, pil_format, **save_kwargs)
+    except Exception as e:
+        return thumb_out, e, False, digest
+    if cached is not None:
+        # Write under a private name and rename, so concurrent builders never
+        # copy a half-written cache entry
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(thumb_out, tmp)
+            os.replace(tmp, cached)
+        except OSError:
+            pass  # Caching is best effort
+    return thumb_out, None, False, digest
+
+
+# Markup the generator emits itself. Autoescaped: titles and alt text come
+# from file names and front matter. Themes receive the result as a string
+# (``cards``), which keeps site-local copies of gallery.html working.
+_COMPONENT_ENV = Environment(autoescape=True)
+
+_GALLERY_CARDS = _COMPONENT_ENV.from_string(
+    "{% for it in items %}"
+    '<a class="gallery-item" href="#" data-full="{{ it.full }}" data-alt="{{ it.alt }}">'
+    '<img src="{{ it.thumb }}" alt="{{ it.alt }}" loading="lazy" />'
+    "</a>{% if not loop.last %}\n{% endif %}"
+    "{% endfor %}"
+)
+
+_BLOG_CARDS = _COMPONENT_ENV.from_string(
+    """{% for post in posts %}<div class="blog-card">
+    <article class="blog-post">
+        <header class="blog-post-header">
+            <h2 class="blog-post-title">{{ post.title }}</h2>
+            {% if post.date %}<p class="meta">{{ post.date }}</p>{% endif %}
+        </header>
+        <div class="blog-post-content markdown-body">
+            {{ post.body|safe }}
+        </div>
+    </article>
+</div>{% if not loop.last %}
+
+{% endif %}{% endfor %}"""
+)
+
+
 def _render_gallery_html(
     items: list[dict[str, Path]],
     current_out_dir: Path,
@@ -217,28 +840,35 @@ def _render_gallery_html(
     if not items:
         return ""
 
-    # Compute relative URLs
+    # Compute relative URLs. Images normally live below the page's directory,
+    # which is a plain string splice; otherwise relpath runs once per image
+    # directory (full images and thumbnails each share one)
+    base = os.path.join(str(current_out_dir), "")
+    dir_hrefs: Dict[str, str] = {}
+
     def href(p: Path) -> str:
-        try:
-            rel = os.path.relpath(p, start=current_out_dir)
-        except Exception:
-            rel = p.name
-        return rel.replace(os.sep, "/")
-
-    cards = "\n".join(
-        [
-            (
-                f'<a class="gallery-item" href="#" data-full="{href(it["full"])}" data-alt="{it["alt"]}">'
-                f'<img src="{href(it["thumb"])}" alt="{it["alt"]}" loading="lazy" />'
-                f"</a>"
-            )
-            for it in items
-        ]
+        path = str(p)
+        if path.startswith(base):
+            return path[len(base):].replace(os.sep, "/")
+        parent, name = os.path.split(path)
+        rel_dir = dir_hrefs.get(parent)
+        if rel_dir is None:
+            try:
+                rel_dir = os.path.relpath(parent, start=current_out_dir).replace(os.sep, "/")
+            except Exception:
+                return p.name
+            dir_hrefs[parent] = rel_dir
+        return name if rel_dir == "." else f"{rel_dir}/{name}"
+
+    # A generator: loop.last only peeks one item ahead, so no list is built
+    cards = _GALLERY_CARDS.render(
+        items=({"full": href(it["full"]), "thumb": href(it["thumb"]), "alt": it["alt"]} for it in items)
     )
 
     # Resolve gallery asset URLs relative to the current output file
-    assets_css = href(assets_root / "gallery.css")
-    assets_js = href(assets_root / "gallery.js")
+    up = _up_prefix(current_out_dir, assets_root)
+    assets_css = up + "gallery.css"
+    assets_js = up + "gallery.js"
 
     # Render using external template
     html = gallery_template.render(
@@ -259,6 +889,8 @@ def _gather_gallery_subtree(
     gallery_template: Template,
     current_out_dir: Path,
     log: Optional[UILog] = None,
+    cache_dir: Optional[Path] = None,
+    thumb_format: str = "webp",
 ) -> str:
     """Gather all _gallery directories in the subtree of current_content_dir that lack index.md, and render them all into HTML."""
     galleries_html = []
@@ -268,7 +900,7 @@ def _gather_gallery_subtree(
     gallery_dir = current_content_dir / "_gallery"
     if gallery_dir.is_dir() and not (gallery_dir / "index.md").exists():
         try:
-            items = _gather_gallery_items(content_root, gallery_dir, output_root, thumb_max_side, log=log)
+            items = _gather_gallery_items(content_root, gallery_dir, output_root, thumb_max_side, log=log, cache_dir=cache_dir, thumb_format=thumb_format)
             if items:
                 gallery_id = f"gallery-subtree-{gallery_id_counter}"
                 gallery_id_counter += 1
@@ -307,16 +939,25 @@ def _gather_files_items(
     if not files_dir.exists() or not files_dir.is_dir():
         return items
 
+    try:
+        rel_dir = files_dir.relative_to(content_root).as_posix()
+    except ValueError:
+        return items
+    href_prefix = "" if rel_dir == "." else rel_dir + "/"
+
     MAX_FILES_ITEMS = 1000
-    files_list = list(sorted(files_dir.iterdir()))[:MAX_FILES_ITEMS]
-    for src_file in files_list:
-        if not src_file.is_file():
+    # Directory entries give the file type without a stat; the one stat per
+    # file then serves both size and date
+    with os.scandir(files_dir) as it:
+        files_list = sorted(it, key=lambda e: e.name)[:MAX_FILES_ITEMS]
+    for entry in files_list:
+        if not entry.is_file():
             continue
-        ext = src_file.suffix.lower()
+        ext = os.path.splitext(entry.name)[1].lower()
         if ext in {".html", ".md"}:
             continue
         # Get file info
-        stat = src_file.stat()
+        stat = entry.stat()
         size_bytes = stat.st_size
         if size_bytes < 1024:
             size_str = f"{size_bytes} B"
@@ -326,17 +967,11 @@ def _gather_files_items(
             size_str = f"{size_bytes / (1024**2):.1f} MB"
         # Date
         date_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(stat.st_mtime))
-        # Href
-        try:
-            rel_from_content = src_file.relative_to(content_root)
-        except Exception:
-            continue
-        href = rel_from_content.as_posix()
         items.append({
-            "name": src_file.name,
+            "name": entry.name,
             "size": size_str,
             "date": date_str,
-            "href": href,
+            "href": href_prefix + entry.name,
         })
 
     return items
@@ -352,10 +987,16 @@ def _render_files_html(
     if not items:
         return ""
 
-    # Compute relative URLs
+    # Compute relative URLs; a listing's files share one directory, whose
+    # relative path is computed once
+    dir_hrefs: Dict[str, str] = {}
+
     def rel_href(p: str) -> str:
-        full_p = output_root / p
-        return os.path.relpath(full_p, start=current_out_dir).replace(os.sep, "/")
+        parent, _, name = p.rpartition("/")
+        rel_dir = dir_hrefs.get(parent)
+        if rel_dir is None:
+            rel_dir = dir_hrefs[parent] = os.path.relpath(output_root / parent, start=current_out_dir).replace(os.sep, "/")
+        return name if rel_dir == "." else f"{rel_dir}/{name}"
 
     name_header = translate("files_name")
     size_header = translate("files_size")
@@ -378,33 +1019,76 @@ def _render_files_html(
     return html
 
 
+# Absolute markdown path -> (mtime_ns, size, parsed post). Blog posts are
+# parsed here; entries stay valid across builds while the file is unchanged.
+_post_cache: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def _load_post(md_file: Path) -> Any:
+    """frontmatter.load, memoized on the file's path, mtime and size.
+
+    The returned Post is shared: callers must not modify it.
+    """
+    key = os.path.abspath(md_file)
+    st = os.stat(key)
+    cached = _post_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    post = frontmatter.load(key)
+    _post_cache[key] = (st.st_mtime_ns, st.st_size, post)
+    return post
+
+
+# A "draft: true" line inside a leading --- block, within the first bytes
+_DRAFT_HINT_RE = re.compile(rb"\A---[ \t]*\r?\n(?:(?!---)[^\n]*\n)*?draft:[ \t]*true\b", re.IGNORECASE)
+_DRAFT_HINT_BYTES = 2048
+
+
+def _is_marked_draft(md_file: Path) -> bool:
+    """Cheap draft test, so drafts skip the full frontmatter.load.
+
+    A regex over the head of the file finds likely drafts; hits are
+    confirmed from the frontmatter block alone. Drafts it misses (other
+    spellings, long front matter) are still dropped after loading.
+    """
+    try:
+        with open(md_file, "rb") as f:
+            head = f.read(_DRAFT_HINT_BYTES)
+    except OSError:
+        return False
+    return _DRAFT_HINT_RE.match(head) is not None and load_title_from_markdown(md_file)[1]
+
+
 def _gather_blog_posts(
     blog_dir: Path,
     log: Optional[UILog] = None,
-) -> List[Tuple[Path, str, str, Optional[str]]]:
+) -> List[Tuple[Path, str, str, Optional[str], str]]:
     """Collect and sort blog posts from a _blog directory.
 
-    Returns list of (md_file_path, title, body_html, date_str) tuples sorted chronologically.
+    Returns list of (md_file_path, title, body_html, date_str, search_text)
+    tuples sorted chronologically; search_text is strip_html(body_html).
     """
     posts = []
     for md_file in blog_dir.glob("*.md"):
         if md_file.is_file() and md_file.name != "index.md":  # Skip index.md as it's used for blog intro
             try:
-                post = frontmatter.load(md_file)
+                if _is_marked_draft(md_file):
+                    continue
+                post = _load_post(md_file)
                 # Skip draft posts
                 if post.metadata.get("draft"):
                     continue
                 title = post.metadata.get("title") or md_file.stem.replace("_", " ").replace("-", " ")
                 date = post.metadata.get("date")
                 body_md = post.content
-                body_html = convert_markdown_to_html(body_md)
-                posts.append((md_file, title, body_html, date))
+                body_html = convert_markdown_to_html(body_md, markdown_digest(body_md))
+                posts.append((md_file, title, body_html, date, strip_html(body_html)))
             except Exception as e:
                 if log is not None:
                     log.write(f"[Blog] Error processing {md_file.name}: {e}")
 
     # Sort by date (frontmatter or mtime), most recent first
-    def sort_key(p: Tuple[Path, str, str, Optional[str]]):
+    def sort_key(p: Tuple[Path, str, str, Optional[str], str]):
         import time
         from datetime import datetime, date
 
@@ -430,31 +1114,36 @@ def _gather_blog_posts(
 
 
 def _render_blog_html(
-    posts: List[Tuple[Path, str, str, Optional[str]]],
+    posts: List[Tuple[Path, str, str, Optional[str], str]],
 ) -> str:
     """Render combined HTML for all blog posts using card-style article elements."""
     if not posts:
         return ""
 
-    articles = []
-    for md_file, title, body_html, date in posts:
-        date_meta = f'<p class="meta">{date}</p>' if date else ""
-        article_html = f"""
-<div class="blog-card">
-    <article class="blog-post">
-        <header class="blog-post-header">
-            <h2 class="blog-post-title">{title}</h2>
-            {date_meta}
-        </header>
-        <div class="blog-post-content markdown-body">
-            {body_html}
-        </div>
-    </article>
-</div>
-""".strip()
-        articles.append(article_html)
+    return _BLOG_CARDS.render(
+        posts=({"title": title, "body": body_html, "date": date} for _, title, body_html, date, _ in posts)
+    )
 
-    return "\n\n".join(articles)
+
+def _write_search_index(path: Path, items: List[dict[str, Any]]) -> None:
+    """Write the search index as compact JSON, encoding one entry at a time.
+
+    The bytes match a single dumps() of the list, without holding the
+    whole encoded index in memory next to the entries. Compact output:
+    the index is only ever read by fetch().json().
+    """
+    if orjson is not None:
+        encode = orjson.dumps
+    else:
+        def encode(item: dict[str, Any]) -> bytes:
+            return json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(b"[")
+        for i, item in enumerate(items):
+            if i:
+                f.write(b",")
+            f.write(encode(item))
+        f.write(b"]")
 
 
 def generate_sitemap_xml(base_url: Optional[str], output_root: Path, search_items: list[dict[str, Any]], log: Optional[UILog] = None) -> None:
@@ -478,42 +1167,39 @@ def generate_sitemap_xml(base_url: Optional[str], output_root: Path, search_item
 
     from datetime import datetime
 
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
-    ]
-
-    for item in search_items:
-        url = item["url"]
-        loc = f"{base_url.rstrip('/')}/{url.lstrip('/')}"
-        lastmod = item.get("date")
-        if lastmod:
-            # Try to format date, fallback to today if invalid
-            try:
+    today = datetime.now().date().isoformat()
+    base = base_url.rstrip('/')
+
+    # Written one <url> at a time (through the file's buffer) rather than
+    # joined into one string first
+    sitemap_path = output_root / "sitemap.xml"
+    with open(sitemap_path, "w", encoding="utf-8", newline="") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+        for item in search_items:
+            url = item["url"]
+            loc = f"{base}/{url.lstrip('/')}"
+            lastmod = item.get("date")
+            if lastmod:
+                # Try to format date, fallback to today if invalid
                 if isinstance(lastmod, str):
                     # Assume ISO format like "2023-09-19" or "2023-09-19T12:00:00"
                     if 'T' in lastmod:
                         lastmod = lastmod.split('T')[0]
-                    elif lastmod.count('-') == 2 and len(lastmod) == 10:
-                        pass  # already YYYY-MM-DD
-                    else:
-                        raise ValueError
+                    elif not (lastmod.count('-') == 2 and len(lastmod) == 10):
+                        lastmod = today
                 else:
-                    lastmod = datetime.now().date().isoformat()
-            except ValueError:
-                lastmod = datetime.now().date().isoformat()
-        else:
-            lastmod = datetime.now().date().isoformat()
+                    lastmod = today
+            else:
+                lastmod = today
 
-        url_element = f" <url>\n  <loc>{loc}</loc>\n  <lastmod>{lastmod}</lastmod>\n </url>"
-        xml_lines.append(url_element)
+            f.write(f"\n <url>\n  <loc>{loc}</loc>\n  <lastmod>{lastmod}</lastmod>\n </url>")
+        f.write('\n</urlset>')
+    info(f"[Sitemap] Generated: {sitemap_path.relative_to(output_root)}")
 
-    xml_lines.append('</urlset>')
 
-    sitemap_path = output_root / "sitemap.xml"
-    sitemap_content = "\n".join(xml_lines)
-    sitemap_path.write_text(sitemap_content, encoding="utf-8")
-    info(f"[Sitemap] Generated: {sitemap_path.relative_to(output_root)}")
+# Content subfolders naming a language, e.g. "en", "it", "it_IT"
+_LANG_DIR_RE = re.compile(r'^[a-z]{2}(_[A-Z]{2})?$')
 
 
 def _detect_languages(site_root: Path) -> tuple[bool, list[str]]:
@@ -529,27 +1215,41 @@ def _detect_languages(site_root: Path) -> tuple[bool, list[str]]:
     if not content_dir.exists():
         return False, []
 
-    lang_pattern = re.compile(r'^[a-z]{2}(_[A-Z]{2})?$')
-    all_entries = list(content_dir.iterdir())
     detected_langs = []
 
-    for entry in all_entries:
-        if entry.is_dir():
-            if lang_pattern.match(entry.name):
-                # Handle cases like "en_US" -> normalize to "en"
-                lang = entry.name.split('_')[0].lower()
-                detected_langs.append(lang)
-            else:
-                # Non-language folder found, site is monolingual
+    # One pass over the directory entries; file types come from the entry
+    with os.scandir(content_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                if _LANG_DIR_RE.match(entry.name):
+                    # Handle cases like "en_US" -> normalize to "en"
+                    lang = entry.name.split('_')[0].lower()
+                    detected_langs.append(lang)
+                else:
+                    # Non-language folder found, site is monolingual
+                    return False, []
+            elif entry.is_file():
+                # Monolingual if files present
                 return False, []
 
-    # Check for any files (monolingual if files present)
-    if any(e.is_file() for e in all_entries):
-        return False, []
-
     return bool(detected_langs and len(detected_langs) > 1), detected_langs
 
 
+# Root index.html of a multilingual site: sends visitors to the default language
+_REDIRECT_TEMPLATE = """<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+    <meta charset="utf-8">
+    <meta http-equiv="refresh" content="0; url={url}">
+    <title>Redirecting...</title>
+</head>
+<body>
+    <p>Redirecting to default language version...</p>
+    <p><a href="{url}">Click here if not redirected</a></p>
+</body>
+</html>"""
+
+
 def generate_site(site_root: Path, log: Optional[UILog] = None) -> None:
     """Generate the static HTML site from a project directory.
 
@@ -566,8 +1266,17 @@ def generate_site(site_root: Path, log: Optional[UILog] = None) -> None:
         else:
             print(msg)
 
-    cfg = read_config(site_root)
+    # Theme and CSS presence is checked (and reported) during generation
+    cfg = read_config(site_root, verify_assets=False)
     info("Loaded config.toml")
+    if not set_markdown_engine(cfg.markdown_engine):
+        info("markdown-it-py is not installed: using Python-Markdown")
+
+    # Content may have been edited since the previous build in this process
+    clear_title_cache()
+    clear_breadcrumb_cache()
+    set_template_cache_dir(site_root / TEMPLATE_CACHE_DIR)
+    set_markdown_cache_dir(site_root / MARKDOWN_CACHE_DIR)
 
     # Detect if multilingual based on content structure
     is_multilingual, detected_langs = _detect_languages(site_root)
@@ -580,14 +1289,25 @@ def generate_site(site_root: Path, log: Optional[UILog] = None) -> None:
         cfg.languages = [cfg.default_language]  # Monolingual
         info("Detected monolingual site, ignoring language settings")
 
-    # Clean root output directory before generation
+    # Clean root output directory before generation. The previous build is
+    # moved aside rather than deleted: unchanged pages are taken back from it
     output_root = sanitize_path(cfg.output, site_root, site_root)
+    previous_output = site_root / PREVIOUS_OUTPUT_DIR
+    if previous_output.exists():
+        shutil.rmtree(previous_output, ignore_errors=True)
+    manifest = _BuildManifest(previous=_load_manifest(site_root))
     if output_root.exists():
         try:
-            shutil.rmtree(output_root)
+            previous_output.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(output_root, previous_output)
+            manifest.previous_output = previous_output
             info(f"Cleaned output directory: {output_root}")
-        except Exception as e:
-            info(f"Warning: failed to clean output directory {output_root}: {e}")
+        except OSError:
+            try:
+                shutil.rmtree(output_root)
+                info(f"Cleaned output directory: {output_root}")
+            except Exception as e:
+                info(f"Warning: failed to clean output directory {output_root}: {e}")
     output_root.mkdir(parents=True, exist_ok=True)
 
     # Copy shared assets to root
@@ -602,58 +1322,575 @@ def generate_site(site_root: Path, log: Optional[UILog] = None) -> None:
     except Exception:
         pass
 
+    # Languages are independent builds: from the command line they run in
+    # parallel processes. The TUI keeps them in-process so its log shows
+    # progress as it happens rather than one language at a time.
+    built: Dict[str, _LanguageResult] = {}
+    workers = min(len(cfg.languages), os.cpu_count() or 1)
+    if log is None and workers >= 2:
+        try:
+            built = _build_languages_in_pool(site_root, output_root, cfg, is_multilingual, manifest, workers)
+        except (OSError, BrokenProcessPool) as e:
+            info(f"Parallel language builds unavailable ({e}); building sequentially")
+
     # Generate for each language
     for lang in cfg.languages:
         set_global_language(lang)
         info(f"Generating site for language: {lang}")
 
         # Language-specific content and output directories
-        content_root = site_root / "content"
-        if len(cfg.languages) > 1:
-            content_root = content_root / lang
-            if not content_root.exists():
-                info(f"Content directory not found for language {lang}: {content_root}")
-                continue
-        # For monolingual, content_root is site_root / "content"
+        content_root, lang_output_root = _language_roots(site_root, output_root, cfg, lang)
+        if not content_root.exists():
+            info(f"Content directory not found for language {lang}: {content_root}")
+            continue
+
+        result = built.get(lang)
+        if result is not None:
+            pages, lines, error = result
+            for line in lines:
+                info(line)
+            if error is not None:
+                raise error
+            manifest.current.update(pages)
+            continue
 
-        lang_output_root = output_root / lang if len(cfg.languages) > 1 else output_root
         lang_output_root.mkdir(parents=True, exist_ok=True)
 
         # Generate site for this language
-        _generate_site_for_language(site_root, content_root, lang_output_root, cfg, lang, is_multilingual, log=log)
+        _generate_site_for_language(site_root, content_root, lang_output_root, cfg, lang, is_multilingual, log=log, manifest=manifest)
 
     # If multilingual, generate root redirect to default language
     if is_multilingual:
         # Create root index.html as redirect page to default language
         redirect_url = f"{cfg.default_language}/"
-        root_index_html = f"""<!DOCTYPE html>
-<html lang="{cfg.default_language}">
-<head>
-    <meta charset="utf-8">
-    <meta http-equiv="refresh" content="0; url={redirect_url}">
-    <title>Redirecting...</title>
-</head>
-<body>
-    <p>Redirecting to default language version...</p>
-    <p><a href="{redirect_url}">Click here if not redirected</a></p>
-</body>
-</html>"""
+        root_index_html = _REDIRECT_TEMPLATE.format(lang=cfg.default_language, url=redirect_url)
         root_index_path = output_root / "index.html"
-        root_index_path.write_text(root_index_html, encoding="utf-8")
+        root_index_path.write_bytes(root_index_html.encode("utf-8"))
         info(f"Generated root redirect to {redirect_url}")
-        # Copy assets for root
-        copy_assets(site_root, output_root)
-        # Copy theme CSS for root
-        css_src = site_root / "assets" / cfg.theme_css
-        if css_src.exists():
-            shutil.copyfile(css_src, output_root / "theme.css")
-            info("Copied theme.css for root redirect")
+        # Shared assets and theme CSS were copied to the root before the
+        # language builds, which write only below it
     else:
         # Monolingual, already generated at root
         pass
 
+    try:
+        _save_manifest(site_root, manifest.current)
+    except OSError as e:
+        info(f"Warning: failed to write build manifest: {e}")
+    if manifest.previous_output is not None:
+        shutil.rmtree(manifest.previous_output, ignore_errors=True)
+    prune_markdown_cache()
+
+
+def _language_roots(site_root: Path, output_root: Path, cfg: SiteConfig, lang: str) -> Tuple[Path, Path]:
+    """Content and output directories of one language build."""
+    if len(cfg.languages) > 1:
+        return site_root / "content" / lang, output_root / lang
+    # For monolingual, content_root is site_root / "content"
+    return site_root / "content", output_root
+
+
+# (manifest entries written, log lines, exception raised if any) of one
+# language built in a worker process
+_LanguageResult = Tuple[Dict[str, Dict[str, Any]], List[str], Optional[BaseException]]
+
+# CPUs this process may give its own pools (None: all of them); set in
+# language workers so their page pools share the machine
+_pool_cpus: Optional[int] = None
+
+
+def _cpu_budget() -> int:
+    """Number of CPUs this process's pools may use."""
+    return _pool_cpus or os.cpu_count() or 1
+
+
+def _build_language_in_worker(
+    args: Tuple[Path, Path, Path, SiteConfig, str, bool, _BuildManifest, int],
+) -> _LanguageResult:
+    """Build one language in a worker process (see _build_languages_in_pool)."""
+    global _pool_cpus
+    site_root, content_root, output_root, cfg, lang, is_multilingual, manifest, cpus = args
+    _pool_cpus = cpus
+    set_global_language(lang)
+    set_template_cache_dir(site_root / TEMPLATE_CACHE_DIR)
+    set_markdown_engine(cfg.markdown_engine)
+    set_markdown_cache_dir(site_root / MARKDOWN_CACHE_DIR)
+    buf = _LogBuffer()
+    try:
+        output_root.mkdir(parents=True, exist_ok=True)
+        _generate_site_for_language(site_root, content_root, output_root, cfg, lang, is_multilingual, log=buf, manifest=manifest)
+    except Exception as e:
+        return manifest.current, buf.lines, e
+    return manifest.current, buf.lines, None
+
+
+def _build_languages_in_pool(
+    site_root: Path,
+    output_root: Path,
+    cfg: SiteConfig,
+    is_multilingual: bool,
+    manifest: _BuildManifest,
+    workers: int,
+) -> Dict[str, _LanguageResult]:
+    """Build every language that has content in its own process.
+
+    Workers buffer their log lines and return them with the manifest
+    entries they wrote, so the caller can replay both in language order.
+    The CPUs are shared out between the workers' own page pools.
+    """
+    cpus = max(1, _cpu_budget() // workers)
+    jobs = []
+    for lang in cfg.languages:
+        content_root, lang_output_root = _language_roots(site_root, output_root, cfg, lang)
+        if content_root.exists():
+            # Each worker starts from an empty manifest.current of its own
+            lang_manifest = _BuildManifest(previous=manifest.previous, previous_output=manifest.previous_output)
+            jobs.append((lang, (site_root, content_root, lang_output_root, cfg, lang, is_multilingual, lang_manifest, cpus)))
+    # spawn for the same reason as the page render pool
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = pool.map(_build_language_in_worker, [args for _, args in jobs])
+        return {lang: result for (lang, _), result in zip(jobs, results)}
+
+
+@dataclass
+class _PageContext:
+    """Read-only inputs shared by every regular page of one language build.
+
+    Picklable, so it can be shipped once to each render worker process.
+    """
+
+    site_root: Path
+    content_root: Path
+    output_root: Path
+    root_output: Path
+    assets_root: Path
+    css_dst: Path
+    cfg: SiteConfig
+    lang: str
+    is_multilingual: bool
+    nav_root: NavNode
+    home_title: Optional[str]
+    theme_path: Path
+    gallery_theme_path: Optional[Path]  # None: gallery pages use the main theme
+    gallery_component_path: Path
+    files_component_path: Path
+    site_context: Dict[str, Any]  # _site_context(cfg, lang, is_multilingual)
+
+
+# (main theme, gallery page theme, gallery component, files component) templates
+_PageTemplates = Tuple[Template, Template, Template, Template]
+
+# Fewer regular pages than this render in-process: worker start-up would dominate
+_RENDER_POOL_MIN = 64
+
+# In-process rendering: page write threads, and rendered pages allowed to
+# wait for them
+_WRITE_WORKERS = 4
+_WRITE_BACKLOG = 32
+
+# Per-worker state set up once by _init_render_worker
+_worker_page_state: Optional[Tuple[_PageContext, _PageTemplates]] = None
+
+
+class _LogBuffer:
+    """Collects log lines in a worker so the parent process can replay them."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def write(self, msg: str) -> None:
+        self.lines.append(msg)
+
+
+def _load_page_templates(ctx: _PageContext) -> _PageTemplates:
+    """Load the templates regular pages need, mirroring the main build's choices."""
+    assets_dir = ctx.site_root / "assets"
+    template = load_template(ctx.theme_path, assets_dir)
+    if ctx.gallery_theme_path is not None:
+        in_site = ctx.gallery_theme_path.parent == assets_dir
+        gallery_theme = load_template(ctx.gallery_theme_path, assets_dir if in_site else None)
+    else:
+        gallery_theme = template
+    return (
+        template,
+        gallery_theme,
+        load_template(ctx.gallery_component_path),
+        load_template(ctx.files_component_path),
+    )
+
+
+def _init_render_worker(payload: bytes) -> None:
+    """Process pool initializer: unpack the shared context and load templates once."""
+    global _worker_page_state
+    ctx = pickle.loads(payload)
+    set_global_language(ctx.lang)
+    set_template_cache_dir(ctx.site_root / TEMPLATE_CACHE_DIR)
+    set_markdown_engine(ctx.cfg.markdown_engine)
+    set_markdown_cache_dir(ctx.site_root / MARKDOWN_CACHE_DIR)
+    _worker_page_state = (ctx, _load_page_templates(ctx))
+
+
+def _render_page_in_worker(md_file: Path) -> Tuple[Optional[dict[str, Any]], List[str]]:
+    """Render one page inside a worker; returns its search entry and log lines."""
+    ctx, templates = _worker_page_state
+    buf = _LogBuffer()
+    return _render_page(md_file, ctx, templates, buf), buf.lines
+
+
+def _render_pages(
+    pages: List[Path],
+    ctx: _PageContext,
+    templates: _PageTemplates,
+    log: Optional[UILog] = None,
+) -> List[Optional[dict[str, Any]]]:
+    """Render regular pages, in a process pool when the site is large enough.
+
+    Pages are independent given the shared context, so markdown conversion
+    and template rendering spread over all cores. Results keep the order of
+    ``pages``; if the pool cannot be used, pages render in this process.
+    """
+    def info(msg: str) -> None:
+        if log is not None:
+            log.write(msg)
+        else:
+            print(msg)
+
+    workers = _cpu_budget()
+    if len(pages) >= _RENDER_POOL_MIN and workers >= 2:
+        try:
+            payload = pickle.dumps(ctx, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            payload = None
+        if payload is not None:
+            try:
+                results: List[Optional[dict[str, Any]]] = []
+                # spawn: the TUI runs generation next to its own threads, which fork would copy mid-state
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_render_worker,
+                    initargs=(payload,),
+                ) as pool:
+                    for item, lines in pool.map(_render_page_in_worker, pages, chunksize=8):
+                        for line in lines:
+                            info(line)
+                        results.append(item)
+                return results
+            except (OSError, BrokenProcessPool) as e:
+                info(f"Parallel rendering unavailable ({e}); rendering sequentially")
+
+    # Pages are written on a few threads (the write releases the GIL), so the
+    # next page renders while the last one goes to disk. At most
+    # _WRITE_BACKLOG pages wait in memory; a failed write raises here.
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as writer:
+        writes: deque = deque()
+
+        def write(path: Path, data: bytes) -> None:
+            if len(writes) >= _WRITE_BACKLOG:
+                writes.popleft().result()
+            writes.append(writer.submit(path.write_bytes, data))
+
+        results = [_render_page(md_file, ctx, templates, log, source=text, write=write) for md_file, text in _prefetch_texts(pages)]
+        while writes:
+            writes.popleft().result()
+    return results
+
+
+# Per-page cache keys of the last build, and where that build is parked meanwhile
+MANIFEST_PATH = CACHE_DIR / "manifest.json"
+PREVIOUS_OUTPUT_DIR = CACHE_DIR / "previous-output"
+
+# Bump when rendering changes in a way that must invalidate cached pages
+_MANIFEST_VERSION = 2
+
+
+@dataclass
+class _BuildManifest:
+    """Page cache keys from the previous build and the ones for this build.
+
+    Entries are keyed by the page's output path relative to the root output
+    directory and hold its cache key and search index entry.
+    """
+
+    previous: Dict[str, Dict[str, Any]]
+    previous_output: Optional[Path] = None
+    current: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def reuse(self, entry_key: str, key: str, out_path: Path) -> bool:
+        """Move the previous build's page into place if its key still matches."""
+        prev = self.previous.get(entry_key)
+        if self.previous_output is None or prev is None or prev.get("key") != key:
+            return False
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(self.previous_output / entry_key, out_path)
+        except OSError:
+            return False
+        return True
 
-def _generate_site_for_language(site_root: Path, content_root: Path, output_root: Path, cfg: SiteConfig, lang: str, is_multilingual: bool, log: Optional[UILog] = None) -> None:
+
+def _load_manifest(site_root: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the page entries of the last build's manifest ({} if unusable)."""
+    data = _read_json_dict(site_root / MANIFEST_PATH)
+    if data.get("version") != _MANIFEST_VERSION:
+        return {}
+    pages = data.get("pages")
+    return pages if isinstance(pages, dict) else {}
+
+
+def _save_manifest(site_root: Path, pages: Dict[str, Dict[str, Any]]) -> None:
+    """Write the manifest atomically, so an interrupted build leaves the old one."""
+    _write_json_atomic(site_root / MANIFEST_PATH, {"version": _MANIFEST_VERSION, "pages": pages})
+
+
+def _page_env_digest(ctx: _PageContext) -> bytes:
+    """Digest of everything a regular page renders from besides its own file.
+
+    Covers config.toml, the language setup, every template the page may use
+    (including anything under the site's assets/ a theme can include, at
+    any depth), the navigation tree, which feeds both the sidebar and the
+    breadcrumbs, and the title and draft flag of every directory's index.md:
+    breadcrumbs read those titles even for draft pages the tree leaves out.
+    """
+    h = _new_hasher()
+    h.update(f"{_MANIFEST_VERSION}\0{ctx.lang}\0{ctx.cfg.languages}\0{ctx.is_multilingual}\0{ctx.home_title}\0{_markdown_it is not None}\0".encode("utf-8"))
+    sources = [ctx.site_root / "config.toml", ctx.theme_path, ctx.gallery_component_path, ctx.files_component_path]
+    if ctx.gallery_theme_path is not None:
+        sources.append(ctx.gallery_theme_path)
+    assets_dir = ctx.site_root / "assets"
+    if assets_dir.is_dir():
+        # Templates load through FileSystemLoader(assets_dir), so includes
+        # can come from subdirectories too: hash the whole tree
+        asset_files: List[Path] = []
+        for dir_path, _, file_names in os.walk(assets_dir):
+            asset_files.extend(Path(dir_path, name) for name in file_names)
+        sources.extend(sorted(asset_files))
+    for path in sources:
+        h.update(str(path).encode("utf-8") + b"\0")
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            pass
+    stack = [ctx.nav_root]
+    while stack:
+        node = stack.pop()
+        h.update(f"{node.is_dir}\0{node.name}\0{node.rel_output_posix}\n".encode("utf-8"))
+        if node.is_dir:
+            index_md = ctx.content_root / node.rel_content_posix / "index.md"
+            if index_md.is_file():
+                title, is_draft = load_title_from_markdown(index_md)
+                h.update(f"{title}\0{is_draft}\n".encode("utf-8"))
+        stack.extend(node.children)
+    return h.digest()
+
+
+def _page_is_cacheable(rel_md: Path, special_parents: List[str]) -> bool:
+    """Whether a page renders from its own file alone (given the shared inputs).
+
+    index.md pages pull in galleries, file lists and blogs from special
+    folders in their subtree, so those are always rendered again.
+    """
+    if rel_md.name.lower() != "index.md":
+        return True
+    if rel_md.parent.name in {"_files", "_gallery", "_blog"}:
+        return False
+    base = rel_md.parent.as_posix()
+    if base == ".":
+        return not special_parents
+    return not any(p == base or p.startswith(base + "/") for p in special_parents)
+
+
+def _render_page(
+    md_file: Path,
+    ctx: _PageContext,
+    templates: _PageTemplates,
+    log: Optional[UILog] = None,
+    source: Optional[str] = None,
+    write: Optional[Callable[[Path, bytes], None]] = None,
+) -> Optional[dict[str, Any]]:
+    """Render one regular (non-blog) markdown page to HTML.
+
+    Runs in the main process or in a render worker, so it only touches its
+    own output file (and gallery thumbnails) and reports through ``log``.
+    ``source`` is the file's text when it was already read ahead; ``write``
+    stores the page (default: Path.write_bytes).
+
+    Returns:
+        The page's search index entry, or None for drafts.
+    """
+    def info(msg: str) -> None:
+        if log is not None:
+            log.write(msg)
+        else:
+            print(msg)
+
+    site_root, content_root, output_root = ctx.site_root, ctx.content_root, ctx.output_root
+    root_output, assets_root, css_dst = ctx.root_output, ctx.assets_root, ctx.css_dst
+    cfg, lang, is_multilingual = ctx.cfg, ctx.lang, ctx.is_multilingual
+    nav_root, home_title, site_ctx = ctx.nav_root, ctx.home_title, ctx.site_context
+    template, gallery_theme, gallery_component_template, files_component_template = templates
+    rel_md = md_file.relative_to(content_root)
+
+    out_rel = rel_md.with_suffix(".html")
+    out_path = output_root / out_rel
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Parse frontmatter and content
+    post = frontmatter.loads(source) if source is not None else frontmatter.load(md_file)
+    # Skip draft pages
+    if post.metadata.get("draft"):
+        return None
+    title = post.metadata.get("title") or md_file.stem.replace("_", " ").replace("-", " ")
+    date = post.metadata.get("date")
+    body_md = post.content
+
+    # Convert markdown to HTML
+    body_html = convert_markdown_to_html(body_md)
+
+    # Special folders only affect index pages: the page of the folder itself
+    # or its parent's. Decide which once
+    is_index = md_file.name.lower() == "index.md"
+    special_name = md_file.parent.name if is_index else None
+
+    # Gallery rendering logic - handles different gallery placement scenarios
+    # 1) If this page is _gallery/index.md, render the gallery here (preferred)
+    if special_name == "_gallery":
+        try:
+            gallery_dir = md_file.parent
+            items = _gather_gallery_items(content_root, gallery_dir, output_root, thumb_max_side=400, log=log, cache_dir=site_root / THUMB_CACHE_DIR, thumb_format=cfg.thumb_format)
+            gallery_html = _render_gallery_html(
+                items,
+                current_out_dir=out_path.parent,
+                assets_root=root_output,
+                gallery_id=f"gallery-{rel_md.parent.as_posix().replace('/', '-') or 'root'}",
+                gallery_template=gallery_component_template,
+            )
+            # Replace the page content with gallery HTML for dedicated gallery pages
+            if gallery_html:
+                body_html = gallery_html
+                info(f"[Gallery] Gallery rendered in: {rel_md}")
+        except Exception as e:
+            info(f"[Gallery] Error generating gallery for {rel_md}: {e}")
+    # Append galleries from subtree without index.md
+    elif is_index:
+        try:
+            current_content_dir = md_file.parent
+            gallery_html = _gather_gallery_subtree(
+                content_root,
+                current_content_dir,
+                output_root,
+                assets_root,
+                thumb_max_side=400,
+                gallery_template=gallery_component_template,
+                current_out_dir=out_path.parent,
+                log=log,
+                cache_dir=site_root / THUMB_CACHE_DIR,
+                thumb_format=cfg.thumb_format,
+            )
+            # Append gallery HTML after the main page content
+            if gallery_html:
+                body_html = f"{body_html}\n\n{gallery_html}"
+                info(f"[Gallery] Galleries appended to {rel_md.parent or Path('.')} from subtree")
+        except Exception as e:
+            info(f"[Gallery] Error generating galleries for {rel_md}: {e}")
+
+    # Files rendering logic - handles different files list placement scenarios
+    # 1) If this page is _files/index.md, render the files list here (preferred)
+    if special_name == "_files":
+        try:
+            files_dir = md_file.parent
+            items = _gather_files_items(content_root, files_dir, log=log)
+            files_html = _render_files_html(
+                items,
+                current_out_dir=out_path.parent,
+                output_root=output_root,
+                files_template=files_component_template,
+            )
+            # Replace the page content with files HTML for dedicated files pages
+            if files_html:
+                body_html = files_html
+                info(f"[Files] Files list rendered in: {rel_md}")
+        except Exception as e:
+            info(f"[Files] Error generating files for {rel_md}: {e}")
+    # 2) Otherwise, if this is a parent index.md and a sibling _files exists WITHOUT its own index.md,
+    #    append the files list to the parent page.
+    elif is_index:
+        files_dir = md_file.parent / "_files"
+        if files_dir.is_dir() and not (files_dir / "index.md").exists():
+            try:
+                items = _gather_files_items(content_root, files_dir, log=log)
+                files_html = _render_files_html(
+                    items,
+                    current_out_dir=out_path.parent,
+                    output_root=output_root,
+                    files_template=files_component_template,
+                )
+                # Append files HTML after the main page content
+                if files_html:
+                    body_html = f"{body_html}\n\n{files_html}"
+                    info(f"[Files] Files list appended to parent: {rel_md.parent or Path('.')}")
+            except Exception as e:
+                info(f"[Files] Error generating files for {rel_md}: {e}")
+
+    # Use default template
+    current_template = template
+
+    # Override template for special content types
+    if "_gallery" in str(rel_md):
+        current_template = gallery_theme
+
+    # Build breadcrumbs (relative to this file's directory)
+    current_out_dir = out_path.parent
+    breadcrumbs = build_breadcrumbs(content_root, output_root, rel_md, current_out_dir, is_multilingual, root_output, home_title)
+
+    # Sidebar HTML (links relative to this file)
+    sidebar_html = render_sidebar_html(nav_root, current_out_dir, output_root, out_rel, is_multilingual, root_output)
+
+    # Compute CSS URL and JS URL relative to the output file
+    css_url = _up_prefix(current_out_dir, css_dst.parent) + css_dst.name
+    common_js_url = _up_prefix(current_out_dir, output_root) + "common.js"
+
+    # Render final HTML
+    html = current_template.render(
+        site_ctx,
+        page_title=title,
+        page_date=str(date) if date else None,
+        content_html=body_html,
+        breadcrumbs=breadcrumbs,
+        sidebar_html=sidebar_html,
+        theme_css_url=css_url,
+        common_js_url=common_js_url,
+    )
+
+    if write is not None:
+        write(out_path, html.encode("utf-8"))
+    else:
+        out_path.write_bytes(html.encode("utf-8"))
+    info(f"Rendered: {out_rel}")
+
+    # Search index entry
+    page_url = out_rel.as_posix()
+    return {
+        "title": title,
+        "url": page_url,
+        "date": str(date) if date else None,
+        "content": strip_html(body_html),
+    }
+
+
+def _site_context(cfg: SiteConfig, lang: str, is_multilingual: bool) -> Dict[str, Any]:
+    """Template variables shared by every page of one language build."""
+    return {
+        "site_name": cfg.site_name,
+        "author": cfg.author,
+        "footer": cfg.footer,
+        "is_multilingual": is_multilingual,
+        "current_lang": lang,
+        "languages": cfg.languages,
+    }
+
+
+def _generate_site_for_language(site_root: Path, content_root: Path, output_root: Path, cfg: SiteConfig, lang: str, is_multilingual: bool, log: Optional[UILog] = None, manifest: Optional[_BuildManifest] = None) -> None:
     """Generate the static HTML site for a single language.
 
     Args:
@@ -662,6 +1899,8 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
         output_root: Path to the output directory for this language.
         cfg: SiteConfig instance.
         log: Optional log widget to report progress in the TUI.
+        manifest: Optional build manifest; unchanged regular pages are
+            reused from the previous build instead of being rendered.
     """
     def info(msg: str) -> None:
         if log is not None:
@@ -674,7 +1913,6 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
     assets_root = root_output
 
     # Load theme template. Prefer site-local theme; else fall back to repo root theme.
-    REPO_ROOT = Path(__file__).resolve().parent  # Adjusted to parent for assets path
     try:
         theme_path = sanitize_path(cfg.base_theme, site_root, site_root)
     except ValueError:
@@ -725,31 +1963,33 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
         raise FileNotFoundError(f"Theme CSS not found: {cfg.theme_css}")
     css_dst = assets_root / css_src.name
 
+    # One walk of the content tree serves the copy, the page list and the
+    # special directories
+    scan = _scan_content(content_root)
+
     # Copy non-markdown files
-    copy_non_markdown_files(content_root, output_root, log)
+    copy_non_markdown_files(content_root, output_root, log, scan.static_files)
 
     # Collect markdown files to render
-    md_files = discover_markdown_files(content_root)
+    md_files = scan.md_files
 
     # Add generated special pages to md_files for navigation
     special_generated = []
-    for special_dir in content_root.rglob("*"):
-        if special_dir.is_dir() and special_dir.name in {"_files", "_gallery", "_blog"}:
-            if not (special_dir / "index.md").exists():
-                rel_special = special_dir.relative_to(content_root)
-                output_special_html = output_root / rel_special / "index.html"
-                if output_special_html.exists():
-                    # Create fake md path for nav
-                    fake_md = special_dir / "index.md"
-                    special_generated.append(fake_md)
+    special_parents: List[str] = []  # content dirs (POSIX, relative) holding a special folder
+    for special_dir in scan.special_dirs:
+        special_parents.append(special_dir.parent.relative_to(content_root).as_posix())
+        if not (special_dir / "index.md").exists():
+            rel_special = special_dir.relative_to(content_root)
+            output_special_html = output_root / rel_special / "index.html"
+            if output_special_html.exists():
+                # Create fake md path for nav
+                fake_md = special_dir / "index.md"
+                special_generated.append(fake_md)
     md_files.extend(special_generated)
     info(f"Discovered {len(md_files)} files (including generated special pages)")
 
     # Collect data for search index
-    search_items: list[dict[str, Any]] = []
-
-    # Track blog folders that have been processed
-    processed_blog_folders = set()
+    search_items: list[Optional[dict[str, Any]]] = []
 
     # Load templates for special directories
     files_template_path = site_root / "assets" / "files.html"
@@ -764,15 +2004,36 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
     gallery_component_template = load_template(gallery_template_path)
     info("[Gallery] Loaded gallery component template")
 
-    # Build nav tree
-    nav_root = build_nav_tree(content_root, output_root)
+    # Build nav tree once: it only depends on the content tree, so the
+    # special pages, blog pages and regular pages below all share it (and
+    # its sidebar cache)
+    nav_root = build_nav_tree(content_root, output_root, workers=_cpu_budget())
+
+    # Home crumb is the same for every page: resolve it once
+    home_md = content_root / "index.md"
+    home_title = load_title_from_markdown(home_md)[0] if home_md.exists() else None
+
+    # Template variables that are the same on every page
+    site_ctx = _site_context(cfg, lang, is_multilingual)
+
+    # A _blog folder without index.md gets its generated page from the
+    # special directory loop and is rendered again as a blog page below:
+    # gather, render and strip its posts only once
+    blog_listings: dict[Path, Tuple[List[Tuple[Path, str, str, Optional[str], str]], str, str]] = {}
+
+    def blog_listing(blog_dir: Path) -> Tuple[List[Tuple[Path, str, str, Optional[str], str]], str, str]:
+        """Return (posts, cards_html, cards_search_text) for a _blog folder."""
+        listing = blog_listings.get(blog_dir)
+        if listing is None:
+            posts = _gather_blog_posts(blog_dir, log)
+            cards_html = _render_blog_html(posts)
+            listing = blog_listings[blog_dir] = (posts, cards_html, strip_html(cards_html))
+        return listing
 
     # Generate pages for special directories without index.md
-    for special_dir in content_root.rglob("*"):
+    for special_dir in scan.special_dirs:
         if special_dir.name == "_gallery":
             continue  # Skip generating separate pages for _gallery without index.md per requirement
-        if not special_dir.is_dir() or special_dir.name not in {"_files", "_gallery", "_blog"}:
-            continue
 
         index_md = special_dir / "index.md"
         if index_md.exists():
@@ -788,38 +2049,28 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
         output_dir.mkdir(parents=True, exist_ok=True)
         out_path = output_dir / "index.html"
 
-        breadcrumbs = build_breadcrumbs(content_root, output_root, Path(str(rel_special_dir) + "/index.md"), output_dir, is_multilingual, root_output)
+        breadcrumbs = build_breadcrumbs(content_root, output_root, Path(str(rel_special_dir) + "/index.md"), output_dir, is_multilingual, root_output, home_title)
         sidebar_html = render_sidebar_html(nav_root, output_dir, output_root, out_path.relative_to(output_root))
-        css_url = os.path.relpath(css_dst, start=output_dir).replace(os.sep, "/")
-        common_js_url = os.path.relpath(root_output / "common.js", start=output_dir).replace(os.sep, "/")
+        css_url = _up_prefix(output_dir, css_dst.parent) + css_dst.name
+        common_js_url = _up_prefix(output_dir, root_output) + "common.js"
 
         special_html = ""
+        special_text = ""  # set when the search text comes with special_html
         title = ""
         current_template = template
 
         if special_dir.name == "_files":
-            # Check if has non-md/html files
-            has_files = any(
-                f.is_file() and f.suffix.lower() not in {".md", ".html"}
-                for f in special_dir.iterdir()
-            )
-            if has_files:
-                items = _gather_files_items(content_root, special_dir, log=log)
-                if items:
-                    special_html = _render_files_html(items, output_dir, output_root, files_template)
-                    title = translate("files_title")
-                else:
-                    continue
+            # Only non-md/html files are listed: no items, no page
+            items = _gather_files_items(content_root, special_dir, log=log)
+            if items:
+                special_html = _render_files_html(items, output_dir, output_root, files_template)
+                title = translate("files_title")
             else:
                 continue
         elif special_dir.name == "_gallery":
             # Check if has images
-            has_images = any(
-                f.is_file() and f.suffix.lower() in IMAGE_EXTS
-                for f in special_dir.iterdir()
-            )
-            if has_images:
-                items = _gather_gallery_items(content_root, special_dir, output_root, thumb_max_side=400, log=log)
+            if _has_file_with_suffix(special_dir, IMAGE_EXTS):
+                items = _gather_gallery_items(content_root, special_dir, output_root, thumb_max_side=400, log=log, cache_dir=site_root / THUMB_CACHE_DIR, thumb_format=cfg.thumb_format)
                 if items:
                     special_html = _render_gallery_html(
                         items,
@@ -835,27 +2086,18 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
             else:
                 continue
         elif special_dir.name == "_blog":
-            # Check if has md files != index.md
-            has_posts = any(
-                f.is_file() and f.suffix.lower() == ".md" and f.name != "index.md"
-                for f in special_dir.iterdir()
-            )
-            if has_posts:
-                posts = _gather_blog_posts(special_dir, log=log)
-                if posts:
-                    special_html = _render_blog_html(posts)  # blog_intro_html empty since no index.md
-                    title = translate("blog_title")
-                    current_template = blog_template if blog_template.exists() else template
-                else:
-                    continue
+            # Drafts and folders without posts both gather nothing
+            posts, special_html, special_text = blog_listing(special_dir)
+            if posts:
+                # blog_intro_html empty since no index.md
+                title = translate("blog_title")
+                current_template = blog_template  # already falls back to the main theme
             else:
                 continue
 
         if special_html:
             html = current_template.render(
-                site_name=cfg.site_name,
-                author=cfg.author,
-                footer=cfg.footer,
+                site_ctx,
                 page_title=title,
                 page_date=None,
                 content_html=special_html,
@@ -863,23 +2105,21 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
                 sidebar_html=sidebar_html,
                 theme_css_url=css_url,
                 common_js_url=common_js_url,
-                is_multilingual=is_multilingual,
-                current_lang=lang,
-                languages=cfg.languages,
             )
-            out_path.write_text(html, encoding="utf-8")
+            out_path.write_bytes(html.encode("utf-8"))
             info(f"[{special_dir.name[1:].capitalize()}] Generated: {out_path.relative_to(output_root)}")
             # Add to search
             search_items.append({
                 "title": title,
                 "url": out_path.relative_to(output_root).as_posix(),
                 "date": None,
-                "content": strip_html(special_html),
+                "content": special_text or strip_html(special_html),
             })
 
-    # Build nav tree
-    nav_root = build_nav_tree(content_root, output_root)
-
+    # Partition md_files in one pass: each blog folder becomes a single unit
+    # at the position of its first post, so the search index order is kept
+    units: list[tuple[Path, Path, Optional[Path]]] = []
+    blog_folders: set[Path] = set()
     for md_file in md_files:
         rel_md = md_file.relative_to(content_root)
 
@@ -887,309 +2127,169 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
         if rel_md.name == "404.md":
             continue
 
-        # Check if this file is inside a _blog directory
-        blog_folder = None
-        for part in reversed(rel_md.parts):
-            if part == "_blog":
-                blog_folder = md_file.parent
-                break
-
-        if blog_folder:
-            # Skip processing individual files in blog folders, they'll be handled as a group
-            if blog_folder not in processed_blog_folders:
-                processed_blog_folders.add(blog_folder)
-                # Process the blog folder
-                try:
-                    posts = _gather_blog_posts(blog_folder, log)
-                    blog_html = _render_blog_html(posts)
-
-                    # Determine the output path for the blog page
-                    blog_rel_path = rel_md.parent / "index.html"
-
-                    # Check if there's an index.md file in the blog folder
-                    index_md_path = blog_folder / "index.md"
-                    blog_intro_html = ""
-                    if index_md_path.exists():
-                        try:
-                            index_post = frontmatter.load(index_md_path)
-                            # Skip draft blog index
-                            if index_post.metadata.get("draft"):
-                                blog_title = md_file.parent.name.replace("_", " ").replace("-", " ") or "Blog"
-                            else:
-                                blog_title_from_md, _ = load_title_from_markdown(index_md_path)
-                                blog_title = index_post.metadata.get("title") or blog_title_from_md or "Blog"
-                                index_content_md = index_post.content.strip()
-                                if index_content_md:
-                                    blog_intro_html = convert_markdown_to_html(index_content_md)
-                        except Exception:
-                            blog_title = md_file.parent.name.replace("_", " ").replace("-", " ") or "Blog"
-                    else:
-                        blog_title = md_file.parent.name.replace("_", " ").replace("-", " ") or "Blog"
-
-                    # Combine intro content with blog posts
-                    if blog_intro_html:
-                        blog_body_html = f"{blog_intro_html}\n\n{blog_html}" if posts else blog_intro_html
-                    else:
-                        blog_body_html = blog_html if posts else "No blog posts found."
-
-                    out_path = output_root / blog_rel_path
-                    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    # Build breadcrumbs and sidebar for blog page
-                    current_out_dir = out_path.parent
-                    breadcrumbs = build_breadcrumbs(content_root, output_root, blog_rel_path.with_suffix(".md"), current_out_dir, is_multilingual, root_output)
-                    sidebar_html = render_sidebar_html(nav_root, current_out_dir, output_root, blog_rel_path, is_multilingual, root_output)
-
-                    # Compute CSS URL and JS URL
-                    try:
-                        css_url = os.path.relpath(css_dst, start=current_out_dir).replace(os.sep, "/")
-                    except Exception:
-                        css_url = css_dst.name
-
-                    # Compute common.js URL relative to the output file
-                    common_js_dst = output_root / "common.js"
-                    try:
-                        common_js_url = os.path.relpath(common_js_dst, start=current_out_dir).replace(os.sep, "/")
-                    except Exception:
-                        common_js_url = common_js_dst.name
-
-    # Blog content is ready
-
-                    # Render blog page HTML using blog template
-                    html = blog_template.render(
-                        site_name=cfg.site_name,
-                        author=cfg.author,
-                        footer=cfg.footer,
-                        page_title=blog_title,
-                        page_date=None,
-                        content_html=blog_intro_html,
-                        blog_posts=blog_html,
-                        breadcrumbs=breadcrumbs,
-                        sidebar_html=sidebar_html,
-                        theme_css_url=css_url,
-                        common_js_url=common_js_url,
-                        is_multilingual=is_multilingual,
-                        current_lang=lang,
-                        languages=cfg.languages,
-                    )
-                    info("[Blog] Successfully rendered using blog template")
-
-                    out_path.write_text(html, encoding="utf-8")
-                    info(f"Rendered blog: {blog_rel_path}")
-
-                    # Add blog page to search index
-                    search_items.append({
-                        "title": blog_title,
-                        "url": blog_rel_path.as_posix(),
-                        "date": None,
-                        "content": strip_html(blog_body_html),
-                    })
-
-                    # Add individual blog posts to search index
-                    for post_md_file, post_title, post_html, post_date in posts:
-                        post_url = blog_rel_path.as_posix()
-                        search_items.append({
-                            "title": post_title,
-                            "url": post_url,
-                            "date": str(post_date) if post_date else None,
-                            "content": strip_html(post_html),
-                        })
-
-                except Exception as e:
-                    info(f"[Blog] Error processing blog folder {blog_folder}: {e}")
-            continue  # Skip this md_file since we processed the whole blog folder
-
-        # Regular file processing (non-blog)
-        out_rel = rel_md.with_suffix(".html")
-        out_path = output_root / out_rel
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Parse frontmatter and content
-        post = frontmatter.load(md_file)
-        # Skip draft pages
-        if post.metadata.get("draft"):
+        if "_blog" in rel_md.parts:
+            blog_folder = md_file.parent
+            if blog_folder in blog_folders:
+                continue
+            blog_folders.add(blog_folder)
+            units.append((md_file, rel_md, blog_folder))
+        else:
+            units.append((md_file, rel_md, None))
+
+    regular_pages: List[Path] = []
+    page_slots: List[int] = []
+    for md_file, rel_md, blog_folder in units:
+        if blog_folder is None:
+            # Regular pages are rendered below, possibly in parallel; keep their
+            # place in the search index so its order does not change
+            page_slots.append(len(search_items))
+            search_items.append(None)
+            regular_pages.append(md_file)
             continue
-        title = post.metadata.get("title") or md_file.stem.replace("_", " ").replace("-", " ")
-        date = post.metadata.get("date")
-        body_md = post.content
 
-        # Convert markdown to HTML
-        body_html = convert_markdown_to_html(body_md)
+        # Render the whole blog folder as one page
+        try:
+            posts, blog_html, blog_text = blog_listing(blog_folder)
 
-        # Gallery rendering logic - handles different gallery placement scenarios
-        # 1) If this page is _gallery/index.md, render the gallery here (preferred)
-        if md_file.name.lower() == "index.md" and md_file.parent.name == "_gallery":
-            try:
-                gallery_dir = md_file.parent
-                items = _gather_gallery_items(content_root, gallery_dir, output_root, thumb_max_side=400, log=log)
-                # Load gallery component template (use site assets, fallback to repo assets)
-                REPO_ROOT = Path(__file__).resolve().parent
-                tpl_path = site_root / "assets" / "gallery.html"
-                if not tpl_path.exists():
-                    tpl_path = REPO_ROOT / "assets" / "gallery.html"
-                gallery_template = load_template(tpl_path)
-                gallery_html = _render_gallery_html(
-                    items,
-                    current_out_dir=out_path.parent,
-                    assets_root=root_output,
-                    gallery_id=f"gallery-{rel_md.parent.as_posix().replace('/', '-') or 'root'}",
-                    gallery_template=gallery_template,
-                )
-                # Replace the page content with gallery HTML for dedicated gallery pages
-                if gallery_html:
-                    body_html = gallery_html
-                    info(f"[Gallery] Gallery rendered in: {rel_md}")
-            except Exception as e:
-                info(f"[Gallery] Error generating gallery for {rel_md}: {e}")
-        # Append galleries from subtree without index.md
-        elif md_file.name.lower() == "index.md":
-            try:
-                current_content_dir = md_file.parent
-                gallery_html = _gather_gallery_subtree(
-                    content_root,
-                    current_content_dir,
-                    output_root,
-                    assets_root,
-                    thumb_max_side=400,
-                    gallery_template=gallery_component_template,
-                    current_out_dir=out_path.parent,
-                    log=log,
-                )
-                # Append gallery HTML after the main page content
-                if gallery_html:
-                    body_html = f"{body_html}\n\n{gallery_html}"
-                    info(f"[Gallery] Galleries appended to {rel_md.parent or Path('.')} from subtree")
-            except Exception as e:
-                info(f"[Gallery] Error generating galleries for {rel_md}: {e}")
+            # Determine the output path for the blog page
+            blog_rel_path = rel_md.parent / "index.html"
 
-        # Files rendering logic - handles different files list placement scenarios
-        # 1) If this page is _files/index.md, render the files list here (preferred)
-        if md_file.name.lower() == "index.md" and md_file.parent.name == "_files":
-            try:
-                files_dir = md_file.parent
-                items = _gather_files_items(content_root, files_dir, log=log)
-                # Load files component template (use site assets, fallback to repo assets)
-                REPO_ROOT = Path(__file__).resolve().parent
-                tpl_path = site_root / "assets" / "files.html"
-                if not tpl_path.exists():
-                    tpl_path = REPO_ROOT / "assets" / "files.html"
-                files_template = load_template(tpl_path)
-                files_html = _render_files_html(
-                    items,
-                    current_out_dir=out_path.parent,
-                    output_root=output_root,
-                    files_template=files_template,
-                )
-                # Replace the page content with files HTML for dedicated files pages
-                if files_html:
-                    body_html = files_html
-                    info(f"[Files] Files list rendered in: {rel_md}")
-            except Exception as e:
-                info(f"[Files] Error generating files for {rel_md}: {e}")
-        # 2) Otherwise, if this is a parent index.md and a sibling _files exists WITHOUT its own index.md,
-        #    append the files list to the parent page.
-        elif md_file.name.lower() == "index.md":
-            files_dir = md_file.parent / "_files"
-            if files_dir.exists() and files_dir.is_dir() and not (files_dir / "index.md").exists():
+            # Check if there's an index.md file in the blog folder
+            index_md_path = blog_folder / "index.md"
+            blog_intro_html = ""
+            if index_md_path.exists():
                 try:
-                    items = _gather_files_items(content_root, files_dir, log=log)
-                    # Load files component template (use site assets, fallback to repo assets)
-                    REPO_ROOT = Path(__file__).resolve().parent
-                    tpl_path = site_root / "assets" / "files.html"
-                    if not tpl_path.exists():
-                        tpl_path = REPO_ROOT / "assets" / "files.html"
-                    files_template = load_template(tpl_path)
-                    files_html = _render_files_html(
-                        items,
-                        current_out_dir=out_path.parent,
-                        output_root=output_root,
-                        files_template=files_template,
-                    )
-                    # Append files HTML after the main page content
-                    if files_html:
-                        body_html = f"{body_html}\n\n{files_html}"
-                        info(f"[Files] Files list appended to parent: {rel_md.parent or Path('.')}")
-                except Exception as e:
-                    info(f"[Files] Error generating files for {rel_md}: {e}")
-
-        # Blog rendering logic - append if sibling _blog exists without index.md
-        elif md_file.name.lower() == "index.md":
-            blog_dir = md_file.parent / "_blog"
-            if blog_dir.exists() and blog_dir.is_dir() and not (blog_dir / "index.md").exists():
-                try:
-                    has_posts = any(
-                        f.is_file() and f.suffix.lower() == ".md" and f.name != "index.md"
-                        for f in blog_dir.iterdir()
-                    )
-                    if has_posts:
-                        posts = _gather_blog_posts(blog_dir, log=log)
-                        blog_html = _render_blog_html(posts)
-                        if blog_html:
-                            body_html = f"{body_html}\n\n{blog_html}"
-                            info(f"[Blog] Blog appended to parent: {rel_md.parent or Path('.')}")
+                    index_post = _load_post(index_md_path)
+                    # Skip draft blog index
+                    if index_post.metadata.get("draft"):
+                        blog_title = md_file.parent.name.replace("_", " ").replace("-", " ") or "Blog"
+                    else:
+                        # Same fallback as load_title_from_markdown, without reading the file again
+                        blog_title = index_post.metadata.get("title") or index_md_path.stem.replace("_", " ").replace("-", " ")
+                        index_content_md = index_post.content.strip()
+                        if index_content_md:
+                            blog_intro_html = convert_markdown_to_html(index_content_md)
+                except Exception:
+                    blog_title = md_file.parent.name.replace("_", " ").replace("-", " ") or "Blog"
+            else:
+                blog_title = md_file.parent.name.replace("_", " ").replace("-", " ") or "Blog"
 
-                except Exception as e:
-                    info(f"[Blog] Error generating blog for {rel_md}: {e}")
+            # Search text of the intro content combined with the blog posts;
+            # the cards were already stripped once for the whole folder
+            if blog_intro_html:
+                intro_text = strip_html(blog_intro_html)
+                blog_body_text = " ".join(filter(None, (intro_text, blog_text))) if posts else intro_text
+            else:
+                blog_body_text = blog_text if posts else "No blog posts found."
 
-        # Use default template
-        current_template = template
+            out_path = output_root / blog_rel_path
+            out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Override template for special content types
-        if "_gallery" in str(rel_md):
-            current_template = gallery_theme
+            # Build breadcrumbs and sidebar for blog page
+            current_out_dir = out_path.parent
+            breadcrumbs = build_breadcrumbs(content_root, output_root, blog_rel_path.with_suffix(".md"), current_out_dir, is_multilingual, root_output, home_title)
+            sidebar_html = render_sidebar_html(nav_root, current_out_dir, output_root, blog_rel_path, is_multilingual, root_output)
 
-        # Build breadcrumbs (relative to this file's directory)
-        current_out_dir = out_path.parent
-        breadcrumbs = build_breadcrumbs(content_root, output_root, rel_md, current_out_dir, is_multilingual, root_output)
+            # Compute CSS URL and JS URL
+            css_url = _up_prefix(current_out_dir, css_dst.parent) + css_dst.name
+            common_js_url = _up_prefix(current_out_dir, output_root) + "common.js"
 
-        # Sidebar HTML (links relative to this file)
-        sidebar_html = render_sidebar_html(nav_root, current_out_dir, output_root, out_rel, is_multilingual, root_output)
+    # Blog content is ready
 
-        # Compute CSS URL and JS URL relative to the output file
-        try:
-            css_url = os.path.relpath(css_dst, start=out_path.parent).replace(os.sep, "/")
-        except Exception:
-            css_url = css_dst.name
+            # Render blog page HTML using blog template
+            html = blog_template.render(
+                site_ctx,
+                page_title=blog_title,
+                page_date=None,
+                content_html=blog_intro_html,
+                blog_posts=blog_html,
+                breadcrumbs=breadcrumbs,
+                sidebar_html=sidebar_html,
+                theme_css_url=css_url,
+                common_js_url=common_js_url,
+            )
+            info("[Blog] Successfully rendered using blog template")
 
-        # Compute common.js URL relative to the output file
-        common_js_dst = output_root / "common.js"
-        try:
-            common_js_url = os.path.relpath(common_js_dst, start=out_path.parent).replace(os.sep, "/")
-        except Exception:
-            common_js_url = common_js_dst.name
+            out_path.write_bytes(html.encode("utf-8"))
+            info(f"Rendered blog: {blog_rel_path}")
 
-        # Render final HTML
-        html = current_template.render(
-            site_name=cfg.site_name,
-            author=cfg.author,
-            footer=cfg.footer,
-            page_title=title,
-            page_date=str(date) if date else None,
-            content_html=body_html,
-            breadcrumbs=breadcrumbs,
-            sidebar_html=sidebar_html,
-            theme_css_url=css_url,
-            common_js_url=common_js_url,
-            is_multilingual=is_multilingual,
-            current_lang=lang,
-            languages=cfg.languages,
-        )
+            # Add blog page to search index
+            search_items.append({
+                "title": blog_title,
+                "url": blog_rel_path.as_posix(),
+                "date": None,
+                "content": blog_body_text,
+            })
 
-        out_path.write_text(html, encoding="utf-8")
-        info(f"Rendered: {out_rel}")
+            # Add individual blog posts to search index
+            for post_md_file, post_title, post_html, post_date, post_text in posts:
+                post_url = blog_rel_path.as_posix()
+                search_items.append({
+                    "title": post_title,
+                    "url": post_url,
+                    "date": str(post_date) if post_date else None,
+                    "content": post_text,
+                })
 
-        # Add to search index
-        page_url = out_rel.as_posix()
-        search_items.append({
-            "title": title,
-            "url": page_url,
-            "date": str(date) if date else None,
-            "content": strip_html(body_html),
-        })
+        except Exception as e:
+            info(f"[Blog] Error processing blog folder {blog_folder}: {e}")
+
+    # Render regular pages
+    ctx = _PageContext(
+        site_root=site_root,
+        content_root=content_root,
+        output_root=output_root,
+        root_output=root_output,
+        assets_root=assets_root,
+        css_dst=css_dst,
+        cfg=cfg,
+        lang=lang,
+        is_multilingual=is_multilingual,
+        nav_root=nav_root,
+        home_title=home_title,
+        theme_path=theme_path,
+        gallery_theme_path=gallery_theme_path if gallery_theme is not template else None,
+        gallery_component_path=gallery_template_path,
+        files_component_path=files_template_path,
+        site_context=site_ctx,
+    )
+    rendered: List[Optional[dict[str, Any]]] = [None] * len(regular_pages)
+    pending = list(range(len(regular_pages)))
+    page_keys: Dict[int, Tuple[str, str]] = {}
+    if manifest is not None:
+        env_digest = _page_env_digest(ctx)
+        pending = []
+        for i, md_file in enumerate(regular_pages):
+            rel_md = md_file.relative_to(content_root)
+            if not _page_is_cacheable(rel_md, special_parents):
+                pending.append(i)
+                continue
+            out_rel = rel_md.with_suffix(".html")
+            entry_key = (output_root / out_rel).relative_to(root_output).as_posix()
+            h = _new_hasher()
+            h.update(env_digest)
+            h.update(md_file.read_bytes())
+            key = h.hexdigest()[:32]
+            page_keys[i] = (entry_key, key)
+            if manifest.reuse(entry_key, key, output_root / out_rel):
+                rendered[i] = manifest.previous[entry_key].get("search")
+                info(f"Unchanged: {out_rel}")
+            else:
+                pending.append(i)
+    templates = (template, gallery_theme, gallery_component_template, files_template)
+    fresh = _render_pages([regular_pages[i] for i in pending], ctx, templates, log)
+    for i, item in zip(pending, fresh):
+        rendered[i] = item
+    if manifest is not None:
+        for i, (entry_key, key) in page_keys.items():
+            manifest.current[entry_key] = {"key": key, "search": rendered[i]}
+    for slot, item in zip(page_slots, rendered):
+        search_items[slot] = item
+    search_items = [item for item in search_items if item is not None]
 
     # Write search index JSON
     search_path = output_root / "search-index.json"
-    search_path.write_text(json.dumps(search_items, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_search_index(search_path, search_items)
     info(f"Search index written: {search_path.relative_to(output_root)}")
 
     # Generate 404.html always in output root using 404 template
@@ -1217,7 +2317,7 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
             theme_css_url=css_url,
             common_js_url=common_js_url,
         )
-        out_path.write_text(html, encoding="utf-8")
+        out_path.write_bytes(html.encode("utf-8"))
         info("Rendered 404.html")
 
     # Copy assets
@@ -1230,28 +2330,13 @@ def _generate_site_for_language(site_root: Path, content_root: Path, output_root
     info(f"Done. Output: {output_root}")
 
 
-def _generate_language_selector(site_root: Path, output_root: Path, cfg: SiteConfig, log: Optional[UILog] = None) -> None:
-    """Generate a root language selector page at output_root/index.html.
-
-    Args:
-        site_root: Path to the site project root.
-        output_root: Path to the root output directory.
-        cfg: SiteConfig instance.
-        log: Optional log widget to report progress in the TUI.
-    """
-    def info(msg: str) -> None:
-        if log is not None:
-            log.write(msg)
-        else:
-            print(msg)
-
-    # Create simple language selector HTML
-    selector_html = f"""<!DOCTYPE html>
+# Root language selector page; {buttons} holds one link per language
+_LANGUAGE_SELECTOR_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{cfg.site_name} - Select Language</title>
+    <title>{site_name} - Select Language</title>
     <style>
         body {{
             font-family: Arial, sans-serif;
@@ -1297,22 +2382,41 @@ def _generate_language_selector(site_root: Path, output_root: Path, cfg: SiteCon
 </head>
 <body>
     <div class="language-selector">
-        <h1 class="site-title">{cfg.site_name}</h1>
+        <h1 class="site-title">{site_name}</h1>
         <p class="site-subtitle">Choose your preferred language</p>
-        <div class="language-buttons">"""
-
-    for lang in cfg.languages:
-        lang_name = {"en": "English", "it": "Italiano"}.get(lang, lang.upper())
-        selector_html += f"""
-            <a href="{lang}/" class="lang-btn">{lang_name}</a>"""
-
-    selector_html += """
+        <div class="language-buttons">{buttons}
         </div>
     </div>
 </body>
 </html>"""
 
+# Display names of the languages shipped with the generator
+_LANGUAGE_NAMES = {"en": "English", "it": "Italiano"}
+
+
+def _generate_language_selector(site_root: Path, output_root: Path, cfg: SiteConfig, log: Optional[UILog] = None) -> None:
+    """Generate a root language selector page at output_root/index.html.
+
+    Args:
+        site_root: Path to the site project root.
+        output_root: Path to the root output directory.
+        cfg: SiteConfig instance.
+        log: Optional log widget to report progress in the TUI.
+    """
+    def info(msg: str) -> None:
+        if log is not None:
+            log.write(msg)
+        else:
+            print(msg)
+
+    # Create simple language selector HTML
+    buttons = "".join(
+        f'\n            <a href="{lang}/" class="lang-btn">{_LANGUAGE_NAMES.get(lang, lang.upper())}</a>'
+        for lang in cfg.languages
+    )
+    selector_html = _LANGUAGE_SELECTOR_TEMPLATE.format(site_name=cfg.site_name, buttons=buttons)
+
     # Write the selector page
     index_path = output_root / "index.html"
-    index_path.write_text(selector_html, encoding="utf-8")
+    index_path.write_bytes(selector_html.encode("utf-8"))
     info("Generated language selector: index.html")